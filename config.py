@@ -27,6 +27,7 @@ UI_SCALE = 1.0    # 提供给 UI/字体的最终缩放
 SCALE_POLICY = "cover"  # cover：一边贴满屏幕；fit：完整显示内容
 SCALE_DIRTY = False  # 渲染surface需要重建时置为 True
 FPS = 120 # 目标帧率
+IDLE_FPS = 10 # 无动画、无输入时的帧率（主循环阻塞等待事件）
 BACKGROUND_COLOR = (30, 30, 50)
 
 # 目录路径
@@ -199,11 +200,19 @@ def get_chinese_font():
 # 中文字体路径
 CHINESE_FONT_PATH = get_chinese_font()
 
-def get_font(size):
-    """获取指定大小的字体"""
-    if CHINESE_FONT_PATH:
-        return pygame.font.Font(CHINESE_FONT_PATH, size)
-    else:
+_default_font_warned = False
+
+def get_font(size, bold=False, italic=False):
+    """获取指定大小的字体（同一字号全局共享同一个 Font 对象，不要修改其样式）"""
+    global _default_font_warned
+    from utils.font_cache import get_font_registry
+    if not CHINESE_FONT_PATH and not _default_font_warned:
         print("使用默认字体，不支持中文显示")
-        return pygame.font.Font(None, size)
+        _default_font_warned = True
+    return get_font_registry().get(CHINESE_FONT_PATH, size, bold, italic)
+
+def render_text(font, text, color, antialias=True, background=None):
+    """渲染文字并缓存结果（返回共享 Surface，不要原地修改）"""
+    from utils.font_cache import get_text_cache
+    return get_text_cache().render(font, text, antialias, color, background)
     
\ No newline at end of file
@@ -0,0 +1,665 @@
+"""
+无界面战斗规则引擎
+与 BattleBaseScene 相同的回合规则（出牌 → 冷却 → 上场 → 攻击 → 清理 → 整理槽位），
+但不依赖计时器与动画回调：一次调用同步结算完整回合，并返回事件列表供场景播放动画。
+用于 AI 搜索与数值平衡模拟。
+"""
+import copy
+import random
+
+from game.skills.skill_base import BattleContext, SkillTrigger
+from game.skills.skill_registry import get_skill_registry
+
+BATTLE_SLOTS_COUNT = 5    # 战斗区槽位数量（与战斗场景一致）
+WAITING_SLOTS_COUNT = 8   # 等候区槽位数量
+PLAYER_MAX_HP = 20        # 双方初始血量
+INITIAL_HAND_SIZE = 3     # 开局手牌数
+MAX_CARDS_PER_TURN = 1    # 每回合最多出牌数
+OWNERS = ("player", "enemy")
+
+
+def _opponent(owner):
+    return "enemy" if owner == "player" else "player"
+
+
+class BattleEvent:
+    """
+    战斗事件：引擎结算时按顺序记录，场景可在结算后依次播放动画
+    kind: draw / play / deploy / skill / attack / hp / immune / player_damage /
+          death / revive / compact / turn_start / game_over
+    槽位统一以 (owner, slot_type, index) 元组表示
+    """
+    __slots__ = ("kind", "owner", "data")
+
+    def __init__(self, kind, owner=None, **data):
+        self.kind = kind
+        self.owner = owner
+        self.data = data
+
+    def __repr__(self):
+        return f"BattleEvent({self.kind!r}, {self.owner!r}, {self.data!r})"
+
+
+class SlotState:
+    """无界面卡槽：提供技能效果所需的 CardSlot 接口子集"""
+    def __init__(self, engine, owner, slot_type, index):
+        self.engine = engine
+        self.owner = owner
+        self.slot_type = slot_type  # battle, waiting, discard
+        self.index = index
+        self.card = None
+        self._card_data = None
+        self.cd_remaining = 0
+        self.listening = ()  # 当前卡牌登记的触发时机（仅战斗槽位）
+
+    @property
+    def key(self):
+        return (self.owner, self.slot_type, self.index)
+
+    @property
+    def card_data(self):
+        return self._card_data
+
+    @card_data.setter
+    def card_data(self, card_data):
+        # 技能效果也会直接赋值 card_data，统一在此维护引擎的触发监听表
+        changed = card_data is not self._card_data
+        self._card_data = card_data
+        if changed and self.slot_type == "battle":
+            self.engine._update_listeners(self)
+
+    def set_card(self, card_data):
+        self.card_data = card_data
+        self.card = card_data  # 兼容性
+        if self.slot_type == "waiting":
+            self.cd_remaining = card_data.cd
+
+    def remove_card(self):
+        card = self.card_data
+        self.card = None
+        self.card_data = None
+        self.cd_remaining = 0
+        return card
+
+    def has_card(self):
+        return self._card_data is not None
+
+    def reduce_cd(self, amount=1):
+        if self.slot_type == "waiting" and self.has_card():
+            self.cd_remaining = max(0, self.cd_remaining - amount)
+            return self.cd_remaining == 0
+        return False
+
+    def increase_cd(self, amount=1):
+        if self.slot_type == "waiting" and self.has_card() and amount > 0:
+            self.cd_remaining = max(0, self.cd_remaining + amount)
+            return True
+        return False
+
+    def start_hp_flash(self, old_hp, new_hp):
+        """场景中用于播放血量闪烁，这里记录为 hp 事件"""
+        if old_hp != new_hp:
+            self.engine.emit("hp", self.owner, slot=self.key, old_hp=old_hp, new_hp=new_hp)
+
+
+class SideState:
+    """单方战斗状态：牌堆、手牌、等候区、战斗区、弃牌堆与血量"""
+    def __init__(self, engine, owner, deck):
+        self.owner = owner
+        self.deck = list(deck)
+        self.hand = []
+        self.discard_pile = []
+        self.battle_slots = [SlotState(engine, owner, "battle", i) for i in range(BATTLE_SLOTS_COUNT)]
+        self.waiting_slots = [SlotState(engine, owner, "waiting", i) for i in range(WAITING_SLOTS_COUNT)]
+        self.discard_slot = SlotState(engine, owner, "discard", 0)
+        self.max_hp = PLAYER_MAX_HP
+        self.current_hp = PLAYER_MAX_HP
+
+
+class BattleState:
+    """完整战斗状态（可 deepcopy 用于 AI 搜索）"""
+    def __init__(self, engine, player_deck, enemy_deck):
+        self.sides = {
+            "player": SideState(engine, "player", player_deck),
+            "enemy": SideState(engine, "enemy", enemy_deck),
+        }
+        self.current_owner = "player"
+        self.turn_number = 1
+        self.cards_played_this_turn = 0
+        self.owner_turn_markers = {"player": 0, "enemy": 0}
+        self.copy_usage_state = {
+            "player": {"turn_marker": 0, "used": False},
+            "enemy": {"turn_marker": 0, "used": False},
+        }
+        self.game_over = False
+        self.winner = None  # player / enemy
+
+
+class HeadlessBattleContext(BattleContext):
+    """无界面战斗上下文：伤害与治疗直接作用于引擎状态"""
+    def deal_damage_to_slot(self, target_slot, damage):
+        if target_slot and target_slot.has_card():
+            traits = getattr(target_slot.card_data, 'traits', []) or []
+            if "免疫" in traits:
+                self.scene.emit("immune", target_slot.owner, slot=target_slot.key)
+                return False
+        return super().deal_damage_to_slot(target_slot, damage)
+
+    def deal_damage_to_player(self, damage):
+        self.scene.damage_player(self.defender_owner, damage)
+        return True
+
+
+class BattleEngine:
+    """同步战斗规则引擎"""
+    def __init__(self, player_deck, enemy_deck, rng=None):
+        self.rng = rng or random.Random()
+        self.events = []
+        self.listeners = {trigger: set() for trigger in SkillTrigger}  # 触发时机 -> 拥有该时机技能的战斗槽位
+        self.state = BattleState(self, player_deck, enemy_deck)
+        self._advance_owner_turn("player")
+
+    @classmethod
+    def new_battle(cls, player_cards, enemy_cards, rng=None, initial_hand_size=INITIAL_HAND_SIZE):
+        """复制双方卡组、洗牌并完成开局抽牌（交替抽取，玩家先手）"""
+        engine = cls(
+            [card.copy() for card in player_cards],
+            [card.copy() for card in enemy_cards],
+            rng=rng,
+        )
+        for side in engine.state.sides.values():
+            engine.rng.shuffle(side.deck)
+        for _ in range(initial_hand_size):
+            engine.draw_card("player")
+            engine.draw_card("enemy")
+        return engine
+
+    def clone(self):
+        """复制当前引擎（含状态与随机数状态），用于 AI 搜索推演"""
+        return copy.deepcopy(self)
+
+    # ==================== 事件 ====================
+    def emit(self, kind, owner=None, **data):
+        self.events.append(BattleEvent(kind, owner, **data))
+
+    def _events_since(self, mark):
+        return self.events[mark:]
+
+    # ==================== 场景接口（供技能效果调用）====================
+    @property
+    def player_battle_slots(self):
+        return self.state.sides["player"].battle_slots
+
+    @property
+    def enemy_battle_slots(self):
+        return self.state.sides["enemy"].battle_slots
+
+    @property
+    def player_waiting_slots(self):
+        return self.state.sides["player"].waiting_slots
+
+    @property
+    def enemy_waiting_slots(self):
+        return self.state.sides["enemy"].waiting_slots
+
+    @property
+    def player_deck(self):
+        return self.state.sides["player"].deck
+
+    @property
+    def enemy_deck(self):
+        return self.state.sides["enemy"].deck
+
+    @property
+    def player_discard_pile(self):
+        return self.state.sides["player"].discard_pile
+
+    @property
+    def enemy_discard_pile(self):
+        return self.state.sides["enemy"].discard_pile
+
+    @property
+    def player_discard_slot(self):
+        return self.state.sides["player"].discard_slot
+
+    @property
+    def enemy_discard_slot(self):
+        return self.state.sides["enemy"].discard_slot
+
+    def get_opposite_slot(self, slot):
+        if slot is None or slot.slot_type != "battle":
+            return None
+        return self.state.sides[_opponent(slot.owner)].battle_slots[slot.index]
+
+    def is_slot_silenced(self, slot):
+        if not slot or not slot.has_card():
+            return False
+        opposite = self.get_opposite_slot(slot)
+        if not opposite or not opposite.has_card():
+            return False
+        traits = getattr(opposite.card_data, 'traits', []) or []
+        return "沉默" in traits
+
+    def get_first_waiting_slot(self, owner):
+        for slot in self.state.sides[owner].waiting_slots:
+            if slot.has_card():
+                return slot
+        return None
+
+    def draw_card(self, owner, animate=False):
+        side = self.state.sides[owner]
+        if not side.deck:
+            return False
+        card_data = side.deck.pop(0)
+        side.hand.append(card_data)
+        self.emit("draw", owner, card_id=card_data.card_id)
+        return True
+
+    def draw_cards_from_deck(self, owner, amount, animate=False):
+        drawn = 0
+        for _ in range(amount):
+            if not self.draw_card(owner):
+                break
+            drawn += 1
+        return drawn
+
+    def draw_from_discard(self, owner, amount, animate=False):
+        side = self.state.sides[owner]
+        drawn_cards = []
+        while len(drawn_cards) < amount and side.discard_pile:
+            card_data = side.discard_pile.pop()
+            self._reset_card_state(card_data)
+            drawn_cards.append(card_data)
+        for card_data in drawn_cards:
+            side.deck.insert(0, card_data)
+            self.emit("revive", owner, card_id=card_data.card_id, to="deck")
+        self._update_discard_preview(owner)
+        return len(drawn_cards)
+
+    def add_card_to_discard(self, owner, card_data):
+        if not card_data:
+            return
+        self._reset_card_state(card_data)
+        self.state.sides[owner].discard_pile.append(card_data)
+        self._update_discard_preview(owner)
+
+    def can_use_copy_skill(self, owner):
+        if owner not in OWNERS:
+            return True
+        state = self.state.copy_usage_state.setdefault(owner, {"turn_marker": 0, "used": False})
+        marker = self.state.owner_turn_markers.get(owner, 0)
+        if state.get("turn_marker") != marker:
+            state["turn_marker"] = marker
+            state["used"] = False
+        return not state.get("used", False)
+
+    def mark_copy_skill_used(self, owner):
+        if owner not in OWNERS:
+            return
+        marker = self.state.owner_turn_markers.get(owner, 0)
+        state = self.state.copy_usage_state.setdefault(owner, {"turn_marker": marker, "used": False})
+        state["turn_marker"] = marker
+        state["used"] = True
+
+    def damage_player(self, owner, damage):
+        side = self.state.sides[owner]
+        side.current_hp -= damage
+        self.emit("player_damage", owner, damage=damage, hp=side.current_hp)
+
+    # ==================== 回合控制 ====================
+    def can_play_card(self):
+        state = self.state
+        if state.game_over or state.cards_played_this_turn >= MAX_CARDS_PER_TURN:
+            return False
+        return not self._owner_slots_full(state.current_owner)
+
+    def legal_plays(self):
+        """当前行动方可打出的手牌下标"""
+        if not self.can_play_card():
+            return []
+        return list(range(len(self.state.sides[self.state.current_owner].hand)))
+
+    def play_card(self, hand_index):
+        """当前行动方将一张手牌打出到最左侧空等候位，返回本次产生的事件"""
+        mark = len(self.events)
+        if not self.can_play_card():
+            return self._events_since(mark)
+        owner = self.state.current_owner
+        side = self.state.sides[owner]
+        target_slot = next((slot for slot in side.waiting_slots if not slot.has_card()), None)
+        if target_slot is None or not (0 <= hand_index < len(side.hand)):
+            return self._events_since(mark)
+        card_data = side.hand.pop(hand_index)
+        target_slot.set_card(card_data)
+        self.state.cards_played_this_turn += 1
+        self.emit("play", owner, card_id=card_data.card_id, slot=target_slot.key)
+        return self._events_since(mark)
+
+    def end_turn(self):
+        """结算当前回合的战斗阶段并切换到下一方，返回本次产生的事件"""
+        mark = len(self.events)
+        if self.state.game_over or self.check_game_over():
+            return self._events_since(mark)
+        self.process_waiting_area()
+        self.move_ready_cards_to_battle()
+        owner = self.state.current_owner
+        attacker_slots = self.state.sides[owner].battle_slots
+        defender_slots = self.state.sides[_opponent(owner)].battle_slots
+        for index, attacker_slot in enumerate(attacker_slots):
+            if attacker_slot.has_card():
+                self.execute_attack(attacker_slot, defender_slots[index], _opponent(owner))
+        self.remove_dead_cards()
+        self.adjust_battle_slots()
+        if not self.check_game_over():
+            self.switch_turn()
+        return self._events_since(mark)
+
+    def run_turn(self, policy=None):
+        """
+        自动完成当前行动方的一整个回合（出牌 + 战斗结算）
+        policy(engine, legal_plays) 返回要打出的手牌下标或 None，默认随机出牌
+        """
+        mark = len(self.events)
+        choices = self.legal_plays()
+        if choices:
+            if policy is None:
+                index = self.rng.choice(choices)
+            else:
+                index = policy(self, choices)
+            if index is not None:
+                self.play_card(index)
+        self.end_turn()
+        return self._events_since(mark)
+
+    def switch_turn(self):
+        state = self.state
+        if state.current_owner == "player":
+            state.current_owner = "enemy"
+        else:
+            state.current_owner = "player"
+            state.turn_number += 1
+        self._advance_owner_turn(state.current_owner)
+        state.cards_played_this_turn = 0
+        self.draw_card(state.current_owner)
+        self.emit("turn_start", state.current_owner, turn=state.turn_number)
+
+    def _advance_owner_turn(self, owner):
+        marker = self.state.owner_turn_markers.get(owner, 0) + 1
+        self.state.owner_turn_markers[owner] = marker
+        usage = self.state.copy_usage_state.setdefault(owner, {"turn_marker": marker, "used": False})
+        usage["turn_marker"] = marker
+        usage["used"] = False
+
+    def _owner_slots_full(self, owner):
+        side = self.state.sides[owner]
+        battle_full = all(slot.has_card() for slot in side.battle_slots)
+        waiting_full = all(slot.has_card() for slot in side.waiting_slots)
+        return battle_full and waiting_full
+
+    def has_cards_alive(self, owner):
+        side = self.state.sides[owner]
+        if side.hand:
+            return True
+        return any(slot.has_card() for slot in side.waiting_slots + side.battle_slots)
+
+    def check_game_over(self):
+        state = self.state
+        if state.game_over:
+            return True
+        player = state.sides["player"]
+        enemy = state.sides["enemy"]
+        if player.current_hp <= 0 or not self.has_cards_alive("player"):
+            state.winner = "enemy"
+        elif enemy.current_hp <= 0 or not self.has_cards_alive("enemy"):
+            state.winner = "player"
+        else:
+            return False
+        state.game_over = True
+        self.emit("game_over", state.winner, turn=state.turn_number)
+        return True
+
+    # ==================== 战斗结算 ====================
+    def process_waiting_area(self):
+        for owner in OWNERS:
+            for slot in self.state.sides[owner].waiting_slots:
+                if slot.has_card():
+                    slot.reduce_cd(1)
+
+    def move_ready_cards_to_battle(self):
+        for owner in OWNERS:
+            side = self.state.sides[owner]
+            for waiting_slot in side.waiting_slots:
+                if not waiting_slot.has_card() or waiting_slot.cd_remaining != 0:
+                    continue
+                target_slot = next((slot for slot in side.battle_slots if not slot.has_card()), None)
+                if target_slot is None:
+                    continue
+                card_data = waiting_slot.card_data
+                target_slot.set_card(card_data)
+                waiting_slot.remove_card()
+                self.emit("deploy", owner, card_id=card_data.card_id,
+                          source=waiting_slot.key, slot=target_slot.key)
+                self._trigger_on_deploy(target_slot, owner)
+
+    # ==================== 技能触发 ====================
+    def _update_listeners(self, slot):
+        """战斗槽位卡牌变化时更新各触发时机的监听槽位"""
+        card_data = slot.card_data
+        if card_data is None and not slot.listening:
+            return
+        triggers = tuple(get_skill_registry().get_card_triggers(card_data)) if card_data is not None else ()
+        if triggers == slot.listening:
+            return
+        for trigger in slot.listening:
+            self.listeners[trigger].discard(slot)
+        for trigger in triggers:
+            self.listeners[trigger].add(slot)
+        slot.listening = triggers
+
+    def has_listeners(self, trigger):
+        """场上是否存在该触发时机的技能"""
+        return bool(self.listeners[trigger])
+
+    def _effects_for(self, slot, trigger, silenced=None):
+        """槽位卡牌在指定触发时机的 (技能, 效果)，无监听或被沉默时为空"""
+        if slot not in self.listeners[trigger]:
+            return ()
+        if silenced is None:
+            silenced = self.is_slot_silenced(slot)
+        if silenced:
+            return ()
+        return get_skill_registry().get_card_effects(slot.card_data, trigger)
+
+    def _resolve_effects(self, effects, trigger, context, slot, owner):
+        for skill, effect in effects:
+            if not effect.can_trigger(context):
+                continue
+            context.skill_target = None
+            context.skill_targets = None
+            if effect.resolve(context):
+                card_id = slot.card_data.card_id if slot.has_card() else None
+                self.emit("skill", owner, slot=slot.key, card_id=card_id,
+                          skill=skill.name, trigger=trigger.value)
+
+    def _trigger_on_deploy(self, slot, owner):
+        effects = self._effects_for(slot, SkillTrigger.ON_DEPLOY)
+        if not effects:
+            return
+        context = HeadlessBattleContext(self)
+        context.set_attacker(slot, owner)
+        self._resolve_effects(effects, SkillTrigger.ON_DEPLOY, context, slot, owner)
+
+    def execute_attack(self, attacker_slot, defender_slot, defender_hp_ref):
+        """执行单次攻击：攻击前技能 → 普通攻击（受伤/反击）→ 攻击后技能"""
+        attacker_card = attacker_slot.card_data
+        attacker_owner = attacker_slot.owner
+        context = HeadlessBattleContext(self)
+        context.set_attacker(attacker_slot, attacker_owner)
+        if defender_slot and defender_slot.has_card():
+            context.set_defender(defender_slot, defender_slot.owner)
+        else:
+            context.defender_slot = None
+            context.defender_owner = defender_hp_ref
+
+        # 沉默状态在攻击开始时确定，攻击前/后技能保持一致
+        attacker_silenced = bool(attacker_slot.listening) and self.is_slot_silenced(attacker_slot)
+        self._resolve_effects(self._effects_for(attacker_slot, SkillTrigger.BEFORE_ATTACK, attacker_silenced),
+                              SkillTrigger.BEFORE_ATTACK, context, attacker_slot, attacker_owner)
+
+        # 普通攻击（自毁等技能可能已移除攻击者）
+        if not attacker_slot.has_card():
+            return
+        context.reset_attack_result()
+        context.skill_target = None
+        context.skill_targets = None
+        target = context.defender_slot
+        if target and target.has_card():
+            defender_card = target.card_data
+            attacker_traits = getattr(attacker_card, "traits", []) or []
+            defender_traits = getattr(defender_card, "traits", []) or []
+            if "飞行" in defender_traits and "飞行" not in attacker_traits:
+                # 地面单位无法对空：伤害转移到防御者玩家
+                damage = attacker_card.atk
+                self.emit("attack", attacker_owner, slot=attacker_slot.key, card_id=attacker_card.card_id,
+                          target=None, damage=damage)
+                self.damage_player(target.owner, damage)
+                context.set_attack_result(damage, target_owner=target.owner, hit_player=True)
+            else:
+                defender_silenced = bool(target.listening) and self.is_slot_silenced(target)
+                context.damage_amount = attacker_card.atk
+                context.set_attacker(target, target.owner)  # 临时切换为防御者视角
+                self._resolve_effects(self._effects_for(target, SkillTrigger.ON_DAMAGED, defender_silenced),
+                                      SkillTrigger.ON_DAMAGED, context, target, target.owner)
+                context.set_attacker(attacker_slot, attacker_owner)
+
+                old_hp = defender_card.hp
+                new_hp = max(0, old_hp - max(0, context.damage_amount))
+                defender_card.hp = new_hp
+                actual_damage = old_hp - new_hp
+                self.emit("attack", attacker_owner, slot=attacker_slot.key, card_id=attacker_card.card_id,
+                          target=target.key, damage=actual_damage)
+                target.start_hp_flash(old_hp, new_hp)
+                context.set_attack_result(actual_damage, target_slot=target, target_owner=target.owner)
+                context.last_damage_taken = actual_damage
+                context.last_attacker_slot = attacker_slot
+                context.last_attacker_owner = attacker_owner
+
+                if actual_damage > 0 and target.has_card():
+                    context.set_attacker(target, target.owner)
+                    self._resolve_effects(self._effects_for(target, SkillTrigger.AFTER_DAMAGED, defender_silenced),
+                                          SkillTrigger.AFTER_DAMAGED, context, target, target.owner)
+                    context.set_attacker(attacker_slot, attacker_owner)
+        else:
+            damage = attacker_card.atk
+            self.emit("attack", attacker_owner, slot=attacker_slot.key, card_id=attacker_card.card_id,
+                      target=None, damage=damage)
+            self.damage_player(defender_hp_ref, damage)
+            context.set_attack_result(damage, target_owner=defender_hp_ref, hit_player=True)
+
+        self._resolve_effects(self._effects_for(attacker_slot, SkillTrigger.AFTER_ATTACK, attacker_silenced),
+                              SkillTrigger.AFTER_ATTACK, context, attacker_slot, attacker_owner)
+
+    def remove_dead_cards(self):
+        """移除 HP <= 0 的卡牌（共享HP的分身一并移除）并处理死亡技能"""
+        dead_cards_info = []
+        for owner in OWNERS:
+            grouped = {}
+            for slot in self.state.sides[owner].battle_slots:
+                if slot.has_card() and slot.card_data.hp <= 0:
+                    key = id(slot.card_data)
+                    if key not in grouped:
+                        grouped[key] = (slot.card_data, owner, slot, [slot])
+                        dead_cards_info.append(grouped[key])
+                    else:
+                        grouped[key][3].append(slot)
+
+        for card_data, owner, primary_slot, linked_slots in dead_cards_info:
+            for linked_slot in linked_slots:
+                if linked_slot.has_card():
+                    linked_slot.remove_card()
+            self.emit("death", owner, card_id=card_data.card_id, slot=primary_slot.key)
+            self.add_card_to_discard(owner, card_data)
+            self._handle_post_death_traits(card_data, owner, slot=primary_slot)
+
+    def _handle_post_death_traits(self, card_data, owner, slot=None):
+        traits = getattr(card_data, 'traits', []) or []
+        if not traits:
+            return
+        effects = get_skill_registry().get_card_effects(card_data, SkillTrigger.ON_DEATH)
+        if effects:
+            context = HeadlessBattleContext(self)
+            if slot:
+                context.set_attacker(slot, owner)
+            else:
+                context.attacker_owner = owner
+            context.death_slot = slot
+            for skill, effect in effects:
+                if effect.can_trigger(context) and effect.resolve(context):
+                    self.emit("skill", owner, slot=slot.key if slot else None, card_id=card_data.card_id,
+                              skill=skill.name, trigger=SkillTrigger.ON_DEATH.value)
+
+        if "不死" in traits:
+            self._revive_card_to_hand(card_data, owner)
+        elif "复活" in traits:
+            self._revive_card_to_waiting(card_data, owner)
+
+    def _remove_card_from_discard(self, card_data, owner):
+        pile = self.state.sides[owner].discard_pile
+        if card_data in pile:
+            pile.remove(card_data)
+            self._update_discard_preview(owner)
+            return True
+        return False
+
+    def _remove_card_from_other_slots(self, card_data, owner, primary_slot=None):
+        for slot in self.state.sides[owner].battle_slots:
+            if slot is primary_slot:
+                continue
+            if slot.has_card() and slot.card_data is card_data:
+                slot.remove_card()
+
+    def _revive_card_to_hand(self, card_data, owner):
+        if not self._remove_card_from_discard(card_data, owner):
+            return
+        self._reset_card_state(card_data)
+        self.state.sides[owner].hand.append(card_data)
+        self.emit("revive", owner, card_id=card_data.card_id, to="hand")
+
+    def _revive_card_to_waiting(self, card_data, owner):
+        if getattr(card_data, '_revive_consumed', False):
+            return
+        target_slot = next((s for s in self.state.sides[owner].waiting_slots if not s.has_card()), None)
+        if target_slot is None:
+            return
+        if not self._remove_card_from_discard(card_data, owner):
+            return
+        self._reset_card_state(card_data)
+        target_slot.set_card(card_data)
+        card_data._revive_consumed = True
+        self.emit("revive", owner, card_id=card_data.card_id, to="waiting", slot=target_slot.key)
+
+    def adjust_battle_slots(self):
+        """战斗区向左填补空位"""
+        for owner in OWNERS:
+            battle_slots = self.state.sides[owner].battle_slots
+            cards_with_slots = [(slot, slot.card_data) for slot in battle_slots if slot.has_card()]
+            if not cards_with_slots:
+                continue
+            for slot in battle_slots:
+                slot.remove_card()
+            for i, (old_slot, card_data) in enumerate(cards_with_slots):
+                battle_slots[i].set_card(card_data)
+                if old_slot is not battle_slots[i]:
+                    self.emit("compact", owner, source=old_slot.key, slot=battle_slots[i].key)
+
+    # ==================== 辅助 ====================
+    def _reset_card_state(self, card_data):
+        if card_data:
+            card_data.hp = getattr(card_data, 'max_hp', card_data.hp)
+
+    def _update_discard_preview(self, owner):
+        side = self.state.sides[owner]
+        if side.discard_pile:
+            side.discard_slot.set_card(side.discard_pile[-1])
+        else:
+            side.discard_slot.remove_card()
@@ -7,6 +7,8 @@ import config
 
 cfg = config
 from utils.card_database import get_card_database, CardData
+from utils.rarity_sampler import weighted_choice
+from utils.card_pool import get_card_pool_index
 
 # 常驻卡池概率
 CARD_PROBABILITIES = {
@@ -444,33 +446,20 @@ class CardSystem:
         return drawn_cards
     
     def get_card_pool(self, prob=CARD_PROBABILITIES):
-        """获取卡池，默认常驻卡池"""
-        pool = {level_dir: [] for level_dir in prob.keys()}
-        
-        for level_dir in pool.keys():
-            level_path = os.path.join("assets/outputs", level_dir) # 不能使用配置中的绝对路径
-            if os.path.exists(level_path):
-                files = [f for f in os.listdir(level_path) 
-                        if f.lower().endswith(('.png', '.jpg', '.jpeg'))]
-                pool[level_dir] = [os.path.join(level_path, f) for f in files]
-            
-            # 如果没有找到图片，添加占位符
-            if not pool[level_dir]:
-                pool[level_dir] = [f"{level_dir}_placeholder_{i}.png" for i in range(5)]
-        
+        """获取卡池，默认常驻卡池（来自共享卡池索引，不再遍历目录）"""
+        index = get_card_pool_index()
+        pool = {}
+        for level_dir in prob.keys():
+            # 如果没有找到卡牌，添加占位符
+            pool[level_dir] = index.get_paths(level_dir) or [f"{level_dir}_placeholder_{i}.png" for i in range(5)]
         return pool
     
     def draw_single_card(self, card_pool, prob=CARD_PROBABILITIES):
-        """抽取单张卡牌"""
-        rand = random.randint(1, 100)
-        cumulative = 0
-        
-        for level_dir, probability in prob.items():
-            cumulative += probability
-            if rand <= cumulative:
-                if card_pool[level_dir]:
-                    card_path = random.choice(card_pool[level_dir])
-                    return level_dir, card_path
+        """抽取单张卡牌（按概率表的实际权重抽取，无需总和为100）"""
+        level_dir = weighted_choice(prob)
+        if level_dir is not None and card_pool.get(level_dir):
+            card_path = random.choice(card_pool[level_dir])
+            return level_dir, card_path
 
         # 如果概率计算未命中，降级到可用卡池的随机卡牌
         available_levels = [level for level, cards in card_pool.items() if cards]
@@ -96,7 +96,7 @@ class DeckRenderer:
         
         # 显示剩余数量
         font = get_font(max(16, int(24 * UI_SCALE)))
-        count_text = font.render(f"{self.card_count}", True, (255, 255, 255))
+        count_text = render_text(font, f"{self.card_count}", (255, 255, 255))
         
         # 数量背景圆形
         text_rect = count_text.get_rect()
@@ -115,7 +115,7 @@ class DeckRenderer:
         # 标签
         label_font = get_font(max(12, int(16 * UI_SCALE)))
         label = "牌堆" if self.is_player else "敌方牌堆"
-        label_text = label_font.render(label, True, (200, 200, 200))
+        label_text = render_text(label_font, label, (200, 200, 200))
         label_rect = label_text.get_rect(centerx=x + self.card_width // 2,
                                          top=y + self.card_height + 5)
         screen.blit(label_text, label_rect)
\ No newline at end of file
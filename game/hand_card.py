@@ -123,6 +123,16 @@ class HandCard:
             self.scale += (self.target_scale - self.scale) * lerp_speed # 平滑缩放
             self.y_offset += (self.target_y_offset - self.y_offset) * lerp_speed # Y轴偏移（悬停时上浮）
             
+    def is_animating(self):
+        """抽牌动画进行中或位置/旋转/缩放尚未收敛到目标"""
+        if self.animation_state != "idle":
+            return True
+        (px, py), (tx, ty) = self.position, self.target_position
+        return (abs(tx - px) > 0.5 or abs(ty - py) > 0.5
+                or abs(self.target_rotation - self.rotation) > 0.1
+                or abs(self.target_scale - self.scale) > 0.002
+                or abs(self.target_y_offset - self.y_offset) > 0.5)
+
     def get_transformed_image(self):
         """获取变换后的图片"""
         # 缩放
@@ -302,6 +312,9 @@ class HandManager:
         """更新所有手牌"""
         for card in self.cards:
             card.update(dt)
+
+    def is_animating(self):
+        return any(card.is_animating() for card in self.cards)
     
     """绘制手牌"""
     def draw(self, screen):
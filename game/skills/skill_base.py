@@ -41,7 +41,11 @@ class SkillEffect:
     def execute(self, context):
         """执行技能效果"""
         raise NotImplementedError("子类必须实现execute方法")
-    
+
+    def resolve(self, context):
+        """无动画结算（供无界面战斗引擎调用），默认等同于execute"""
+        return self.execute(context)
+
     def get_animation(self, context):
         """获取技能动画"""
         return None
@@ -52,15 +56,35 @@ class Skill:
         self.skill_id = skill_id
         self.name = name
         self.effects = effects or []  # 技能效果列表
+        self._trigger_index = None    # 触发时机 -> 效果元组
     
     def add_effect(self, effect):
         """添加技能效果"""
         self.effects.append(effect)
+        self._trigger_index = None
         return self
+
+    def _build_trigger_index(self):
+        index = {}
+        for effect in self.effects:
+            index.setdefault(effect.trigger, []).append(effect)
+        self._trigger_index = {trigger: tuple(effects) for trigger, effects in index.items()}
+        return self._trigger_index
+
+    @property
+    def triggers(self):
+        """该技能包含的所有触发时机"""
+        index = self._trigger_index
+        if index is None:
+            index = self._build_trigger_index()
+        return index.keys()
     
     def get_effects_by_trigger(self, trigger):
-        """获取指定触发时机的效果"""
-        return [e for e in self.effects if e.trigger == trigger]
+        """获取指定触发时机的效果（按触发时机建立的索引，返回元组）"""
+        index = self._trigger_index
+        if index is None:
+            index = self._build_trigger_index()
+        return index.get(trigger, ())
     
     def execute_trigger(self, trigger, context):
         """执行指定触发时机的所有效果"""
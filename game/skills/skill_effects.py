@@ -365,20 +365,18 @@ class HealAllyEffect(SkillEffect):
         
         return True
     
-    def get_animation(self, context):
-        """返回治愈动画"""
-        from game.skills.skill_animations import HealAnimation
-        
+    def _select_target(self, context):
+        """选择治愈目标：优先随机受伤友方（不包括自己），否则治疗自己"""
         # 获取友方随机单位（不包括自己）
         attacker_owner = "player" if context.attacker_slot in context.scene.player_battle_slots else "enemy"
-        
+
         if attacker_owner == "player":
-            ally_slots = [s for s in context.scene.player_battle_slots 
+            ally_slots = [s for s in context.scene.player_battle_slots
                          if s.has_card() and s != context.attacker_slot]
         else:
-            ally_slots = [s for s in context.scene.enemy_battle_slots 
+            ally_slots = [s for s in context.scene.enemy_battle_slots
                          if s.has_card() and s != context.attacker_slot]
-        
+
         # 过滤掉满血的
         valid_targets = []
         for slot in ally_slots:
@@ -386,21 +384,32 @@ class HealAllyEffect(SkillEffect):
             max_hp = card.max_hp if hasattr(card, 'max_hp') else card.hp
             if card.hp < max_hp:
                 valid_targets.append(slot)
-        
+
         # 如果有友方可治疗，随机选择一个
         if valid_targets:
-            import random
-            target = random.choice(valid_targets)
-            context.skill_target = target  # 缓存目标
-            return HealAnimation(context.attacker_slot, target, self.heal_amount)
-        
+            return random.choice(valid_targets)
+
         # 如果没有友方，治疗自己
         card = context.attacker_slot.card_data
         max_hp = card.max_hp if hasattr(card, 'max_hp') else card.hp
         if card.hp < max_hp:
-            context.skill_target = context.attacker_slot
-            return HealAnimation(context.attacker_slot, context.attacker_slot, self.heal_amount)
-        
+            return context.attacker_slot
+
+        return None
+
+    def resolve(self, context):
+        context.skill_target = self._select_target(context)
+        return self.execute(context)
+
+    def get_animation(self, context):
+        """返回治愈动画"""
+        from game.skills.skill_animations import HealAnimation
+
+        target = self._select_target(context)
+        if target:
+            context.skill_target = target  # 缓存目标
+            return HealAnimation(context.attacker_slot, target, self.heal_amount)
+
         return None
 
 class GroupHealEffect(SkillEffect):
@@ -567,7 +576,15 @@ class CounterAttackEffect(SkillEffect):
             return False
         self.last_target = context.last_attacker_slot
         return True
-    
+
+    def resolve(self, context):
+        # 动画流程中伤害在反击动画结束时结算，无动画时直接结算
+        if not self.execute(context):
+            return False
+        target_slot = self.last_target
+        self.last_target = None
+        return context.deal_damage_to_slot(target_slot, self.damage)
+
     def get_animation(self, context):
         if not self.last_target:
             return None
@@ -792,6 +809,8 @@ class CopyEffect(SkillEffect):
         return None
 
     def _duplicate_card(self, card):
+        if hasattr(card, "copy"):
+            return card.copy()
         return copy.deepcopy(card)
 
     def execute(self, context):
@@ -1,5 +1,8 @@
 """技能注册表：管理所有技能 支持通过ID或traits标签快速获取技能"""
 import re
+import copy
+from collections import OrderedDict
+from game.skills.skill_base import Skill
 from game.skills.skill_effects import (
     create_fireball_skill, # 火球n
     create_ice_skill, # 冰封n
@@ -38,6 +41,56 @@ from game.skills.skill_effects import (
     create_explode_on_death_skill, # 爆裂
 )
 
+# 参数化技能：前缀n -> 工厂函数（按前缀长度降序匹配，"群体火球"优先于"火球"）
+PARAM_SKILL_FACTORIES = {
+    "火球": create_fireball_skill,
+    "冰封": create_ice_skill,
+    "闪电": create_lightning_skill,
+    "群体火球": create_aoe_fireball_skill,
+    "群体冰封": create_aoe_ice_skill,
+    "群体闪电": create_aoe_lightning_skill,
+    "抽卡": create_draw_skill,
+    "还魂": create_revive_skill,
+    "加速": create_accelerate_skill,
+    "延迟": create_delay_skill,
+    "祝福": create_blessing_skill,
+    "群体祝福": create_group_blessing_skill,
+    "振奋": create_inspire_skill,
+    "群体振奋": create_group_inspire_skill,
+    "诅咒": create_curse_skill,
+    "破甲": create_break_armor_skill,
+    "防御": create_defense_skill,
+    "治愈": create_heal_ally_skill,
+    "群体治愈": create_group_heal_skill,
+    "恢复": create_self_heal_skill,
+    "吸血": create_vampire_skill,
+    "受伤": create_injury_skill,
+    "反击": create_counter_skill,
+    "闪避": create_dodge_skill,
+    "炮击": create_bombard_skill,
+    "群体爆破": create_group_bombard_skill,
+}
+
+# 无参数技能：完整trait -> 工厂函数
+PLAIN_SKILL_FACTORIES = {
+    "自毁": create_self_destruct_skill,
+    "沉默": create_silence_skill,
+    "免疫": create_immunity_skill,
+    "不死": create_undying_skill,
+    "复活": create_rebirth_skill,
+    "狂暴": create_berserk_skill,
+    "分身": create_clone_skill,
+    "复制": create_copy_skill,
+    "爆裂": create_explode_on_death_skill,
+}
+
+_PARAM_TRAIT_RE = re.compile(
+    "(" + "|".join(sorted(PARAM_SKILL_FACTORIES, key=len, reverse=True)) + r")(\d+)"
+)
+
+SKILL_CACHE_SIZE = 256  # trait -> Skill 缓存上限
+_NO_SKILL = object()    # 缓存"无对应技能"的trait（如 飞行）
+
 class SkillRegistry:
     """技能注册表（单例）"""
     _instance = None
@@ -54,6 +107,9 @@ class SkillRegistry:
         
         self.skills = {}  # skill_id -> Skill对象
         self.trait_to_skill = {}  # trait -> skill_id 映射
+        self._trait_cache = OrderedDict()  # trait -> Skill（LRU）
+        self.cache_hits = 0
+        self.cache_misses = 0
         self._initialized = True
         
     def register_skill(self, skill, traits=None):
@@ -69,209 +125,47 @@ class SkillRegistry:
         return self.skills.get(skill_id)
     
     def get_skill_by_trait(self, trait):
-        """通过trait标签获取技能"""
+        """
+        通过trait标签获取技能（带缓存）
+        返回的Skill为同一trait共享的只读模板，不要修改或直接用于有状态的结算，
+        卡牌结算请使用 get_card_skills 获取卡牌独立的技能副本
+        """
         # 先检查直接映射
         skill_id = self.trait_to_skill.get(trait)
         if skill_id:
             return self.skills.get(skill_id)
-        
-        # 动态解析参数化技能
-        # 火球n
-        match = re.match(r"火球(\d+)", trait)
-        if match:
-            damage = int(match.group(1))
-            return create_fireball_skill(damage)
-        
-        # 冰封n
-        match = re.match(r"冰封(\d+)", trait)
-        if match:
-            damage = int(match.group(1))
-            return create_ice_skill(damage)
-        
-        # 闪电n
-        match = re.match(r"闪电(\d+)", trait)
-        if match:
-            damage = int(match.group(1))
-            return create_lightning_skill(damage)
-        
-        # 群体火球n
-        match = re.match(r"群体火球(\d+)", trait)
-        if match:
-            damage = int(match.group(1))
-            return create_aoe_fireball_skill(damage)
-        
-        # 群体冰封n
-        match = re.match(r"群体冰封(\d+)", trait)
-        if match:
-            damage = int(match.group(1))
-            return create_aoe_ice_skill(damage)
-        
-        # 群体闪电n
-        match = re.match(r"群体闪电(\d+)", trait)
-        if match:
-            damage = int(match.group(1))
-            return create_aoe_lightning_skill(damage)
-
-        # 抽卡n
-        match = re.match(r"抽卡(\d+)", trait)
-        if match:
-            amount = int(match.group(1))
-            return create_draw_skill(amount)
-
-        # 还魂n
-        match = re.match(r"还魂(\d+)", trait)
-        if match:
-            amount = int(match.group(1))
-            return create_revive_skill(amount)
-
-        # 加速n
-        match = re.match(r"加速(\d+)", trait)
-        if match:
-            amount = int(match.group(1))
-            return create_accelerate_skill(amount)
-
-        # 延迟n
-        match = re.match(r"延迟(\d+)", trait)
-        if match:
-            amount = int(match.group(1))
-            return create_delay_skill(amount)
-
-        # 自毁
-        if trait == "自毁":
-            return create_self_destruct_skill()
-
-        # 沉默
-        if trait == "沉默":
-            return create_silence_skill()
-
-        # 免疫
-        if trait == "免疫":
-            return create_immunity_skill()
-
-        # 不死
-        if trait == "不死":
-            return create_undying_skill()
-
-        # 复活
-        if trait == "复活":
-            return create_rebirth_skill()
-        
-        # 祝福n
-        match = re.match(r"祝福(\d+)", trait)
-        if match:
-            amount = int(match.group(1))
-            return create_blessing_skill(amount)
-
-        # 群体祝福n
-        match = re.match(r"群体祝福(\d+)", trait)
-        if match:
-            amount = int(match.group(1))
-            return create_group_blessing_skill(amount)
-
-        # 振奋n
-        match = re.match(r"振奋(\d+)", trait)
-        if match:
-            amount = int(match.group(1))
-            return create_inspire_skill(amount)
 
-        # 群体振奋n
-        match = re.match(r"群体振奋(\d+)", trait)
-        if match:
-            amount = int(match.group(1))
-            return create_group_inspire_skill(amount)
-
-        # 诅咒n
-        match = re.match(r"诅咒(\d+)", trait)
-        if match:
-            amount = int(match.group(1))
-            return create_curse_skill(amount)
-
-        # 破甲n
-        match = re.match(r"破甲(\d+)", trait)
-        if match:
-            amount = int(match.group(1))
-            return create_break_armor_skill(amount)
-
-        # 防御n
-        match = re.match(r"防御(\d+)", trait)
-        if match:
-            reduction = int(match.group(1))
-            return create_defense_skill(reduction)
-        
-        # 治愈n
-        match = re.match(r"治愈(\d+)", trait)
-        if match:
-            heal_amount = int(match.group(1))
-            return create_heal_ally_skill(heal_amount)
-
-        # 群体治愈n
-        match = re.match(r"群体治愈(\d+)", trait)
-        if match:
-            heal_amount = int(match.group(1))
-            return create_group_heal_skill(heal_amount)
-        
-        # 恢复n
-        match = re.match(r"恢复(\d+)", trait)
-        if match:
-            heal_amount = int(match.group(1))
-            return create_self_heal_skill(heal_amount)
-        
-        # 吸血n
-        match = re.match(r"吸血(\d+)", trait)
-        if match:
-            heal_amount = int(match.group(1))
-            return create_vampire_skill(heal_amount)
-        
-        # 受伤n
-        match = re.match(r"受伤(\d+)", trait)
-        if match:
-            dmg = int(match.group(1))
-            return create_injury_skill(dmg)
-        
-        # 反击n
-        match = re.match(r"反击(\d+)", trait)
-        if match:
-            dmg = int(match.group(1))
-            return create_counter_skill(dmg)
-        
-        # 闪避n
-        match = re.match(r"闪避(\d+)", trait)
-        if match:
-            lvl = int(match.group(1))
-            return create_dodge_skill(lvl)
-
-        # 狂暴
-        if trait == "狂暴":
-            return create_berserk_skill()
-
-        # 分身
-        if trait == "分身":
-            return create_clone_skill()
-
-        # 复制
-        if trait == "复制":
-            return create_copy_skill()
-
-        # 炮击n
-        match = re.match(r"炮击(\d+)", trait)
-        if match:
-            damage = int(match.group(1))
-            return create_bombard_skill(damage)
+        cache = self._trait_cache
+        skill = cache.get(trait)
+        if skill is not None:
+            self.cache_hits += 1
+            cache.move_to_end(trait)
+        else:
+            self.cache_misses += 1
+            skill = self._build_skill(trait)
+            if skill is None:
+                skill = _NO_SKILL
+            else:
+                skill.effects = tuple(skill.effects)
+            cache[trait] = skill
+            if len(cache) > SKILL_CACHE_SIZE:
+                cache.popitem(last=False)
+        return None if skill is _NO_SKILL else skill
+
+    def _build_skill(self, trait):
+        """解析trait并创建技能（仅在缓存未命中时调用）"""
+        factory = PLAIN_SKILL_FACTORIES.get(trait)
+        if factory:
+            return factory()
+
+        match = _PARAM_TRAIT_RE.match(trait)
+        if match:
+            return PARAM_SKILL_FACTORIES[match.group(1)](int(match.group(2)))
 
-        # 群体爆破n
-        match = re.match(r"群体爆破(\d+)", trait)
-        if match:
-            damage = int(match.group(1))
-            return create_group_bombard_skill(damage)
-
-        # 爆裂
-        if trait == "爆裂":
-            return create_explode_on_death_skill()
-        
         return None
-    
+
     def get_skills_from_traits(self, traits):
-        """从卡牌的traits列表获取所有技能"""
+        """从卡牌的traits列表获取所有技能（共享模板）"""
         skills = []
         for trait in traits:
             skill = self.get_skill_by_trait(trait)
@@ -279,6 +173,58 @@ class SkillRegistry:
                 skills.append(skill)
         return skills
 
+    def get_card_skills(self, card_data):
+        """
+        获取卡牌的技能列表：每张卡持有独立的效果副本（效果会记录目标等临时状态），
+        计算结果缓存在卡牌上，traits变化后自动重新生成
+        """
+        return self._card_skill_entry(card_data)[1]
+
+    def get_card_effects(self, card_data, trigger):
+        """获取卡牌在指定触发时机的 (技能, 效果) 元组，无监听时返回空元组"""
+        return self._card_skill_entry(card_data)[2].get(trigger, ())
+
+    def get_card_triggers(self, card_data):
+        """获取卡牌技能涉及的所有触发时机"""
+        return self._card_skill_entry(card_data)[2].keys()
+
+    def _card_skill_entry(self, card_data):
+        """(traits, 技能列表, 触发时机 -> ((技能, 效果), ...) 索引)"""
+        traits = getattr(card_data, 'traits', []) or []
+        key = tuple(traits)
+        cached = getattr(card_data, '_skill_cache', None)
+        if cached is not None and cached[0] == key:
+            return cached
+
+        skills = []
+        index = {}
+        for template in self.get_skills_from_traits(traits):
+            skill = Skill(template.skill_id, template.name, [copy.copy(effect) for effect in template.effects])
+            skills.append(skill)
+            for effect in skill.effects:
+                index.setdefault(effect.trigger, []).append((skill, effect))
+        entry = (key, skills, {trigger: tuple(pairs) for trigger, pairs in index.items()})
+        try:
+            card_data._skill_cache = entry
+        except AttributeError:
+            pass
+        return entry
+
+    def clear_cache(self):
+        """清空trait缓存与统计"""
+        self._trait_cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def cache_info(self):
+        """缓存统计"""
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "size": len(self._trait_cache),
+            "max_size": SKILL_CACHE_SIZE,
+        }
+
 
 # 全局单例
 _skill_registry = None
@@ -15,6 +15,7 @@ import pygame
 import config
 from importlib import import_module
 from ui.transition import Transition
+from utils.frame_scheduler import FrameScheduler
 
 """场景管理器"""
 class SceneManager:
@@ -34,6 +35,11 @@ class SceneManager:
         
         pygame.display.set_caption("Card Battle Master")
         self.clock = pygame.time.Clock()
+        self.frame_scheduler = FrameScheduler(self.clock, config.FPS, idle_fps=config.IDLE_FPS)
+        self._full_frames_pending = 1  # 需要整帧提交的帧数（转场、缩放变化后至少整帧刷新一次）
+        self._fps_label = None
+        self._fps_rect = None
+        self._fps_label_time = 0
         
         # 场景字典
         self.scenes = {}
@@ -148,11 +154,14 @@ class SceneManager:
 
         while running:
             design_changed = self._apply_scene_design_policy()
+            if design_changed or config.SCALE_DIRTY:
+                self._full_frames_pending = 1
             self._handle_scale_change(force=design_changed)
-            dt = self.clock.tick(config.FPS) / 1000.0
+            # 有动画时按目标帧率运行，空闲时降频并阻塞等待输入
+            dt = self.frame_scheduler.tick(self._is_animating())
 
             # 事件处理：如果splash正在运行优先交给splash处理，否则交给当前场景
-            for raw_event in pygame.event.get():
+            for raw_event in self.frame_scheduler.get_events():
                 if raw_event.type == pygame.QUIT:
                     running = False
                 else:
@@ -172,6 +181,7 @@ class SceneManager:
                 self.transition.draw(self.display)
                 self.draw_fps()
                 pygame.display.flip()
+                self._full_frames_pending = 1
                 continue
 
             # 检查退出标志quit_flag，若为真则退出主循环
@@ -191,6 +201,18 @@ class SceneManager:
                     self.current_scene.next_scene = None
                     self.switch_scene(next_scene)
 
+            # 脏矩形模式：场景声明支持且无转场时只重绘变化区域
+            dirty_rects = self.current_scene.consume_dirty_rects() if self.current_scene else None
+            if self.transition.is_transitioning:
+                self._full_frames_pending = 1
+                dirty_rects = None
+            elif self._full_frames_pending:
+                self._full_frames_pending -= 1
+                dirty_rects = None
+            if dirty_rects is not None:
+                self._present_dirty(dirty_rects)
+                continue
+
             # 绘制当前场景（含提示框）
             if self.current_scene:
                 self.render_surface.fill(config.BACKGROUND_COLOR)
@@ -199,7 +221,7 @@ class SceneManager:
             # 绘制到真实屏幕并叠加转场/FPS
             self._blit_render_surface()
             self.transition.draw(self.display)
-            self.draw_fps()
+            self._fps_rect = self.draw_fps()
             pygame.display.flip()
 
         # 退出前清理悬停框资源
@@ -212,16 +234,61 @@ class SceneManager:
         pygame.quit()
         sys.exit()
     
+    def _is_animating(self):
+        """启动画面、转场或当前场景声明有动画时需要全速运行"""
+        if getattr(self, "splash", None) is not None and self.splash.running:
+            return True
+        if self.transition.is_transitioning or self.pending_scene:
+            return True
+        return bool(self.current_scene and self.current_scene.is_animating())
+
     def draw_fps(self):
-        """绘制FPS信息"""
+        """绘制FPS信息，返回绘制区域"""
         font = config.get_font(max(12, int(20 * config.UI_SCALE)))
-        fps_text = font.render(
-            f"FPS: {int(self.clock.get_fps())}", 
-            True, (150, 150, 150)
-        )
+        fps_text = config.render_text(font, f"FPS: {int(self.clock.get_fps())}", (150, 150, 150))
         draw_x = config.VIEW_DEST_X + int(config.VISIBLE_WIDTH * 0.92)
         draw_y = config.VIEW_DEST_Y + int(config.VISIBLE_HEIGHT * 0.02)
-        self.display.blit(fps_text, (draw_x, draw_y))
+        return self.display.blit(fps_text, (draw_x, draw_y))
+
+    def _present_dirty(self, rects):
+        """只重绘并提交变化区域；无变化时仅按间隔刷新 FPS 文字"""
+        updates = []
+        view_rect = pygame.Rect(config.VIEW_SRC_X, config.VIEW_SRC_Y,
+                                config.VISIBLE_WIDTH, config.VISIBLE_HEIGHT)
+        if rects:
+            area = rects[0].unionall(rects[1:]).clip(self.render_surface.get_rect())
+            if area.width > 0 and area.height > 0:
+                # 场景照常绘制，但裁剪到变化区域，未变化的像素保持不动
+                self.render_surface.set_clip(area)
+                self.render_surface.fill(config.BACKGROUND_COLOR)
+                self.current_scene.draw_with_tooltip()
+                self.render_surface.set_clip(None)
+                updates.append(self._blit_render_region(area, view_rect))
+
+        now = pygame.time.get_ticks()
+        label = f"FPS: {int(self.clock.get_fps())}"
+        if updates or (label != self._fps_label and now - self._fps_label_time >= 500):
+            self._fps_label = label
+            self._fps_label_time = now
+            if self._fps_rect:
+                # 先用场景内容覆盖旧的 FPS 文字
+                updates.append(self._blit_render_region(
+                    self._fps_rect.move(config.VIEW_SRC_X - config.VIEW_DEST_X,
+                                        config.VIEW_SRC_Y - config.VIEW_DEST_Y),
+                    view_rect))
+            self._fps_rect = self.draw_fps()
+            updates.append(self._fps_rect)
+
+        updates = [rect for rect in updates if rect.width > 0 and rect.height > 0]
+        if updates:
+            pygame.display.update(updates)
+
+    def _blit_render_region(self, area, view_rect):
+        """将渲染surface上的区域（渲染坐标）复制到屏幕，返回屏幕坐标下的区域"""
+        area = area.clip(view_rect)
+        dest = (area.x - config.VIEW_SRC_X + config.VIEW_DEST_X,
+                area.y - config.VIEW_SRC_Y + config.VIEW_DEST_Y)
+        return self.display.blit(self.render_surface, dest, area)
 
     def _translate_event(self, event):
         """将鼠标事件转换到渲染区域坐标系"""
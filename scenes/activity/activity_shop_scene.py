@@ -10,7 +10,8 @@ from scenes.base.base_scene import BaseScene
 from ui.background import ParallaxBackground
 from ui.menu_button import MenuButton
 from ui.system_ui import CurrencyLevelUI, DEFAULT_BADGE_ICON
-from utils.card_database import CardDatabase
+from utils.card_database import get_card_database
+from utils.card_pool import get_card_pool_index
 from utils.inventory import get_inventory
 
 BADGE_PRICE_RULES = {
@@ -50,7 +51,7 @@ class ActivityShopScene(BaseScene):
         self.currency_ui = CurrencyLevelUI()
         self.currency_ui.load_state()
 
-        self.card_db = CardDatabase()
+        self.card_db = get_card_database()
         self.card_image_cache = {}
         self.badge_icon = self._load_badge_icon(int(46 * UI_SCALE))
         self.badge_icon_small = self._load_badge_icon(int(28 * UI_SCALE))
@@ -458,9 +459,7 @@ class ActivityShopScene(BaseScene):
 
     def _sample_cards(self, rarities, count, allow_repeat, rng=None):
         rng = rng or random
-        pool = []
-        for rarity in rarities:
-            pool.extend(self.card_db.get_cards_by_rarity(rarity))
+        pool = get_card_pool_index().get_cards_for(rarities)
         if not pool:
             return []
 
@@ -12,6 +12,7 @@ from ui.background import ParallaxBackground
 from ui.menu_button import MenuButton
 from ui.poster_detail_panel import PosterDetailPanel
 from utils.card_database import get_card_database
+from utils.card_pool import get_card_pool_index
 from utils.scene_payload import set_payload
 
 class ActivityMazeScene(BaseScene):
@@ -998,11 +999,11 @@ class ActivityMazeScene(BaseScene):
         return explored / max(1, len(self.nodes))
 
     def _sample_enemy_cards(self, deck_size, strength_value):
-        db = get_card_database()
-        all_cards = db.get_all_cards()
+        pool_index = get_card_pool_index()
+        grouped = pool_index.grouped()
+        all_cards = pool_index.all_cards
         if not all_cards:
             return [self._build_fallback_card_entry(strength_value, idx) for idx in range(deck_size)]
-        grouped = {rarity: list(db.get_cards_by_rarity(rarity)) for rarity in {card.rarity for card in all_cards}}
         cards = []
         high_bias = max(0.05, min(0.75, 0.25 + (strength_value - 1.0) * 0.2))
         mid_bias = max(0.2, min(0.9, 0.4 + (strength_value - 0.8) * 0.2))
@@ -1064,7 +1065,7 @@ class ActivityMazeScene(BaseScene):
     def _roll_shop_cards(self, count=None):
         desired = count or self.SHOP_CARD_COUNT
         db = get_card_database()
-        pool = [card for card in db.get_all_cards() if not getattr(card, "is_event_card", False)]
+        pool = db.query().event(False).cards()
         if not pool:
             return []
         selected = []
@@ -8,12 +8,18 @@ from ui.tooltip import get_tooltip # 导入全局 tooltip 获取函数
 """场景基类"""
 class BaseScene(ABC):
     force_native_resolution = False
+    # 脏矩形渲染（可选）：子类置 True 后需在内容变化时调用 mark_dirty，
+    # 场景管理器只重绘并提交变化区域，无变化的帧不绘制
+    supports_dirty_rects = False
 
     def __init__(self, screen):
         self.screen = screen
         self.next_scene = None  # 下一个要跳转的场景
         self.is_active = True
         self.tooltip = get_tooltip()  # 添加全局 tooltip
+        self._dirty_rects = []
+        self._full_redraw = True
+        self._tooltip_state = None
     
     """处理事件"""
     @abstractmethod
@@ -34,11 +40,50 @@ class BaseScene(ABC):
     """进入场景时调用"""
     def enter(self):
         self.is_active = True
+        self.mark_dirty()
         
     """退出场景时调用"""
     def exit(self):
         self.is_active = False
     
+    """
+    是否有正在进行的动画：返回 False 时主循环在无输入后降为低帧率
+    默认视为一直有动画（保持原有的全速运行），可声明空闲状态的场景需重写
+    """
+    def is_animating(self):
+        return True
+
+    """标记需要重绘的区域，rect 为 None 时整帧重绘"""
+    def mark_dirty(self, rect=None):
+        if rect is None:
+            self._full_redraw = True
+        elif not self._full_redraw:
+            self._dirty_rects.append(pygame.Rect(rect))
+
+    """收集控件的变化区域（控件需提供 get_dirty_rect()）"""
+    def collect_dirty(self, widgets):
+        for widget in widgets:
+            rect = widget.get_dirty_rect()
+            if rect is not None:
+                self.mark_dirty(rect)
+
+    """
+    取出本帧的脏矩形：返回 None 表示需要整帧重绘，
+    否则返回变化区域列表（空列表表示本帧无需重绘）
+    """
+    def consume_dirty_rects(self):
+        tooltip = self.tooltip
+        tooltip_state = (tooltip.visible, tooltip.position, id(tooltip.surface)) if tooltip.visible else None
+        if tooltip_state != self._tooltip_state:
+            self._tooltip_state = tooltip_state
+            self._full_redraw = True
+        if not self.supports_dirty_rects or self._full_redraw:
+            self._full_redraw = False
+            self._dirty_rects = []
+            return None
+        rects, self._dirty_rects = self._dirty_rects, []
+        return rects
+
     """切换到其他场景"""
     def switch_to(self, scene_name):
         self.next_scene = scene_name
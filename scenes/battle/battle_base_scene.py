@@ -18,6 +18,7 @@ from game.card_animation import SlideAnimation # 滑动动画
 from game.card_animation import AttackAnimation # 攻击动画
 from game.skills import get_skill_registry, BattleContext, SkillTrigger # 技能系统
 from game.card_system import CARD_PROBABILITIES
+from utils.rarity_sampler import weighted_choice
 from ui.system_ui import CurrencyLevelUI
 
 # 背景设置
@@ -264,6 +265,21 @@ class BattleBaseScene(BaseScene):
                 who, _ = self.draw_queue.pop(0)
                 self.draw_card(who, animate=True)
 
+    def is_animating(self):
+        """战斗动画、抽牌队列、敌方回合（AI 计时）或任一控件动画进行中"""
+        if self.game_over:
+            return False
+        if (self.battle_animations or self.turn_phase == "battling" or self.draw_queue
+                or self.turn_indicator_animating or self.current_turn == "player2"):
+            return True
+        if self.player_hand.is_animating() or self.enemy_hand.is_animating():
+            return True
+        if self.player_health_bar.is_animating() or self.enemy_health_bar.is_animating():
+            return True
+        slots = (self.player_battle_slots + self.enemy_battle_slots
+                 + self.player_waiting_slots + self.enemy_waiting_slots)
+        return any(slot.is_animating() for slot in slots)
+
     def handle_event(self, event):
         super().handle_event(event)
 
@@ -438,7 +454,7 @@ class BattleBaseScene(BaseScene):
         for rarity in event_rarities:
             event_cards.extend(db.get_cards_by_rarity(rarity) or [])
         if not event_cards:
-            event_cards = [card for card in db.get_all_cards() if getattr(card, "is_event_card", False)]
+            event_cards = db.query().event(True).cards()
         if not event_cards:
             return None
         return random.choice(event_cards)
@@ -460,17 +476,7 @@ class BattleBaseScene(BaseScene):
     def _weighted_rarity_choice(self, probability_map):
         if not probability_map:
             return None
-        total = sum(probability_map.values())
-        if total <= 0:
-            return None
-        roll = random.uniform(0, total)
-        accum = 0.0
-        for rarity, weight in probability_map.items():
-            accum += weight
-            if roll <= accum:
-                return rarity
-        # 回退到最后一个键
-        return next(iter(probability_map))
+        return weighted_choice(probability_map)
 
     def _end_battle(self, winner: str):
         if self.game_over:
@@ -1321,7 +1327,7 @@ class BattleBaseScene(BaseScene):
         if self.is_slot_silenced(attacker_slot):
             skills = []
         else:
-            skills = skill_registry.get_skills_from_traits(attacker_card.traits)
+            skills = skill_registry.get_card_skills(attacker_card)
         
         # 定义普通攻击执行函数（在技能动画完成后调用）
         def execute_normal_attack():
@@ -1374,7 +1380,7 @@ class BattleBaseScene(BaseScene):
                             if self.is_slot_silenced(context.defender_slot):
                                 defender_skills = []
                             else:
-                                defender_skills = skill_registry.get_skills_from_traits(defender_card.traits)
+                                defender_skills = skill_registry.get_card_skills(defender_card)
                             context.damage_amount = base_damage  # 将伤害存入context
                             
                             # 设置防御者上下文
@@ -1863,10 +1869,7 @@ class BattleBaseScene(BaseScene):
                 death_context.death_slot = slot
             return death_context
 
-        for trait in traits:
-            skill = registry.get_skill_by_trait(trait)
-            if not skill:
-                continue
+        for skill in registry.get_card_skills(card_data):
             effects = skill.get_effects_by_trigger(SkillTrigger.ON_DEATH)
             if not effects:
                 continue
@@ -1949,7 +1952,7 @@ class BattleBaseScene(BaseScene):
         if not traits:
             return
         registry = get_skill_registry()
-        skills = registry.get_skills_from_traits(traits)
+        skills = registry.get_card_skills(card)
         if not skills:
             return
         context = BattleContext(self)
@@ -1,11 +1,9 @@
 """基于预设的牌库deck 关卡常规战斗场景（玩家 vs AI）"""
 import os
-import json
 import random
 import pygame
-import copy
 from scenes.battle.battle_base_scene import BattleBaseScene # 战斗场景基类
-from utils.card_database import get_card_database, CardData # 卡牌数据库
+from utils.deck_manager import load_deck_cards, load_deck_entries # 卡组读取
 from utils.scene_payload import pop_payload
 
 PLAYER_DECK_PATH = "data/deck/player_deck/deck.json"  # 玩家牌库JSON路径
@@ -157,38 +155,8 @@ class SimpleBattleScene(BattleBaseScene):
 
     """====================其他===================="""
     def _load_deck_json(self, json_path):
-        """从json文件或DeckManager获取deck entries，并转换为CardData列表"""
-        deck = []
-        entries = self._load_deck_entries(json_path)
-        db = get_card_database()
-        for entry in entries:
-            path = entry.get("path", "")
-            rarity = entry.get("rarity", "C")
-
-            card_data = None
-            try:
-                card_data = copy.deepcopy(db.get_card_by_path(path)) # 使用 deepcopy 避免双方卡组引用同一对象！！
-            except Exception as e:
-                print(f"[SimpleBattle] db.get_card_by_path 抛出异常: path='{path}', err={e}")
-                card_data = None
-
-            if card_data is None:
-                filename = os.path.splitext(os.path.basename(path))[0]
-                inferred_id = f"{rarity}_{filename}"
-                print(f"[SimpleBattle] 在数据库中找不到卡牌 record: path='{path}', inferred_id='{inferred_id}' - 使用 fallback CardData")
-                card_data = CardData(
-                    card_id=inferred_id,
-                    name=entry.get("name", f"Card {filename}"),
-                    rarity=rarity,
-                    atk=entry.get("atk", 0),
-                    hp=entry.get("hp", 0),
-                    cd=entry.get("cd", 0),
-                    image_path=path
-                )
-
-            deck.append(card_data)
-    
-        return deck
+        """从json文件获取deck entries，并转换为CardData列表"""
+        return load_deck_cards(json_path)
 
     def enemy_ai_play_card(self):
         """简单的敌人AI：随机出一张手牌（如果可出）"""
@@ -209,18 +177,7 @@ class SimpleBattleScene(BattleBaseScene):
         return False
 
     def _load_deck_entries(self, json_path):
-        if not json_path:
-            return []
-        if not os.path.exists(json_path):
-            print(f"[SimpleBattle] 未找到卡组文件: {json_path}")
-            return []
-        try:
-            with open(json_path, "r", encoding="utf-8") as fp:
-                data = json.load(fp)
-            return data.get("deck", [])
-        except Exception as err:
-            print(f"[SimpleBattle] 读取卡组失败: {json_path} -> {err}")
-            return []
+        return load_deck_entries(json_path)
 
     def _apply_payload(self, payload: dict):
         stage_id = payload.get("stage_id") or payload.get("stage")
@@ -238,7 +238,7 @@ class DeckSlot:
             
             # 槽位编号
             font = get_font(max(16, int(24 * UI_SCALE)))
-            text = font.render(str(self.index + 1), True, (180, 180, 180))
+            text = render_text(font, str(self.index + 1), (180, 180, 180))
             text_rect = text.get_rect(center=self.rect.center)
             screen.blit(text, text_rect)
     
@@ -248,7 +248,7 @@ class DeckSlot:
         pygame.draw.rect(screen, color, self.rect)
         
         font = get_font(max(20, int(30 * UI_SCALE)))
-        text = font.render(self.card.get("rarity", "?"), True, (255, 255, 255))
+        text = render_text(font, self.card.get("rarity", "?"), (255, 255, 255))
         text_rect = text.get_rect(center=self.rect.center)
         screen.blit(text, text_rect)
 
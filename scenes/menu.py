@@ -24,9 +24,12 @@ poster_to_scene = {
 poster_topleft = (int(WINDOW_WIDTH * 0.58), int(WINDOW_HEIGHT * 0.6))
 
 class MainMenuScene(BaseScene):
+    supports_dirty_rects = True  # 静止时不重绘，长时间停留在主菜单几乎不占用 CPU/GPU
+
     def __init__(self, screen):
         super().__init__(screen)
         self.settings_modal = None
+        self._frame_state = None
         self._build_static_ui()
 
     def _build_static_ui(self):
@@ -114,6 +117,21 @@ class MainMenuScene(BaseScene):
                 self.notice_message = ""
         if self.settings_modal:
             self.settings_modal.update(dt)
+        self._mark_dirty_regions()
+
+    def is_animating(self):
+        if self.settings_modal or self.background.is_animating() or self.poster_ui.is_animating():
+            return True
+        return any(button.is_animating() for button in self.buttons)
+
+    def _mark_dirty_regions(self):
+        """背景移动、提示或设置弹窗变化时整帧重绘，否则只重绘状态变化的按钮与海报"""
+        frame_state = (self.background.view_origin(), self.notice_message, self.settings_modal)
+        if self.settings_modal or frame_state != self._frame_state:
+            self._frame_state = frame_state
+            self.mark_dirty()
+        self.collect_dirty(self.buttons)
+        self.collect_dirty((self.poster_ui,))
     
     def draw(self):
         self.background.draw(self.screen) # 背景
@@ -11,7 +11,8 @@ from scenes.base.base_scene import BaseScene
 from ui.background import ParallaxBackground
 from ui.menu_button import MenuButton
 from ui.system_ui import CurrencyLevelUI, DEFAULT_GOLD_ICON, DEFAULT_CRYSTAL_ICON
-from utils.card_database import CardDatabase
+from utils.card_database import get_card_database
+from utils.card_pool import get_card_pool_index
 
 CARD_PRICE_RULES = {
     "SSS": {"currency": "crystal", "amount": 551},
@@ -56,7 +57,7 @@ class ShopScene(BaseScene):
         self.currency_ui = CurrencyLevelUI()
         self.currency_ui.load_state()
 
-        self.card_db = CardDatabase()
+        self.card_db = get_card_database()
         self.card_image_cache = {}
         self.cost_icons = self._load_cost_icons()
         self.pack_image = self._load_pack_image()
@@ -257,9 +258,7 @@ class ShopScene(BaseScene):
 
     def _sample_cards(self, rarities, count, allow_repeat, rng=None):
         rng = rng or random
-        pool = []
-        for rarity in rarities:
-            pool.extend(self.card_db.get_cards_by_rarity(rarity))
+        pool = get_card_pool_index().get_cards_for(rarities)
         if not pool:
             return []
 
@@ -13,6 +13,7 @@ from ui.scroll_view import ScrollView
 from ui.system_ui import CurrencyLevelUI
 from utils.inventory import get_inventory
 from utils.card_database import get_card_database, CardData
+from utils.rarity_sampler import weighted_choice
 
 
 class WorkshopScene(BaseScene):
@@ -549,14 +550,8 @@ class WorkshopScene(BaseScene):
         return all(slot for slot in self.altar_slots) and not self.animations
 
     def _weighted_choice(self, distribution):
-        total = sum(distribution.values())
-        roll = random.uniform(0, total)
-        current = 0.0
-        for rarity, weight in distribution.items():
-            current += weight
-            if roll <= current:
-                return rarity
-        return self.RARITY_ORDER[-1]
+        rarity = weighted_choice(distribution)
+        return rarity if rarity is not None else self.RARITY_ORDER[-1]
 
     def _draw_card_by_rarity(self, rarity):
         pool = self.card_db.get_cards_by_rarity(rarity)
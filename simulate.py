@@ -0,0 +1,188 @@
+"""
+批量蒙特卡洛对战模拟：两套卡组 AI vs AI 随机出牌对战，用于卡组/关卡平衡性测试
+
+用法:
+    python simulate.py PLAYER_DECK ENEMY_DECK [-n 10000] [-j 8] [--seed 0] [--json out.json]
+
+卡组文件格式与 SimpleBattleScene 读取的 deck.json 相同。
+对局按批次分发到进程池，每个批次使用由 (seed, 批次号) 推导出的独立随机数流，
+因此相同的 seed / 局数 / 批次大小 下结果可复现，与进程数无关。
+"""
+import os
+import sys
+import argparse
+import random
+import time
+import json
+import multiprocessing
+from collections import Counter
+
+DEFAULT_MATCHES = 1000
+DEFAULT_BATCH_SIZE = 250  # 每个任务包含的对局数
+DEFAULT_MAX_TURNS = 200   # 单局最大行动次数（双方各行动一次计2，超过判平局）
+
+def _ensure_working_directory():
+    """切换到项目根目录，保证卡组中的相对资源路径可被数据库解析"""
+    try:
+        os.chdir(os.path.abspath(os.path.dirname(__file__)))
+    except OSError as err:
+        print(f"[Simulate] 无法切换工作目录: {err}")
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+# 子进程内缓存的卡组（由 _init_worker 加载一次）
+_worker_decks = None
+
+def _init_worker(player_deck_path, enemy_deck_path):
+    global _worker_decks
+    from utils.deck_manager import load_deck_cards
+    _worker_decks = (load_deck_cards(player_deck_path), load_deck_cards(enemy_deck_path))
+
+def _batch_seed(base_seed, batch_index):
+    """由基础种子与批次号推导批次种子（互不重叠的随机数流）"""
+    return random.Random(f"{base_seed}:{batch_index}").getrandbits(64)
+
+def play_match(player_cards, enemy_cards, rng, max_turns=DEFAULT_MAX_TURNS):
+    """运行一局对战，返回结束时的引擎"""
+    from game.battle_engine import BattleEngine
+
+    engine = BattleEngine.new_battle(player_cards, enemy_cards, rng=rng)
+    turns = 0
+    while not engine.state.game_over and turns < max_turns:
+        engine.run_turn()
+        turns += 1
+    return engine
+
+def new_stats():
+    return {
+        "matches": 0,
+        "wins": Counter(),       # player / enemy / draw
+        "turns": 0,              # 总回合数（用于平均）
+        "damage": Counter(),     # card_id -> 普通攻击造成的伤害
+        "skills": Counter(),     # 技能名 -> 触发次数
+    }
+
+def merge_stats(total, part):
+    total["matches"] += part["matches"]
+    total["turns"] += part["turns"]
+    for key in ("wins", "damage", "skills"):
+        total[key].update(part[key])
+    return total
+
+def record_match(stats, engine):
+    stats["matches"] += 1
+    stats["wins"][engine.state.winner or "draw"] += 1
+    stats["turns"] += engine.state.turn_number
+    for event in engine.events:
+        if event.kind == "attack":
+            stats["damage"][event.data.get("card_id")] += event.data.get("damage", 0)
+        elif event.kind == "skill":
+            stats["skills"][event.data.get("skill")] += 1
+
+def run_batch(task):
+    """运行一个批次的对局 task = (batch_index, count, base_seed, max_turns)"""
+    batch_index, count, base_seed, max_turns = task
+    seed = _batch_seed(base_seed, batch_index)
+    # 技能效果内部使用全局 random，需与引擎随机数流一起设定种子
+    random.seed(seed)
+    rng = random.Random(seed)
+    player_cards, enemy_cards = _worker_decks
+    stats = new_stats()
+    for _ in range(count):
+        record_match(stats, play_match(player_cards, enemy_cards, rng, max_turns))
+    return stats
+
+def simulate(player_deck_path, enemy_deck_path, matches=DEFAULT_MATCHES, jobs=None,
+             seed=0, batch_size=DEFAULT_BATCH_SIZE, max_turns=DEFAULT_MAX_TURNS):
+    """运行 matches 局对战并汇总统计，jobs<=1 时在当前进程内运行"""
+    jobs = jobs or os.cpu_count() or 1
+    batch_size = max(1, batch_size)
+    tasks = []
+    remaining = matches
+    while remaining > 0:
+        count = min(batch_size, remaining)
+        tasks.append((len(tasks), count, seed, max_turns))
+        remaining -= count
+
+    total = new_stats()
+    if jobs <= 1 or len(tasks) <= 1:
+        _init_worker(player_deck_path, enemy_deck_path)
+        for task in tasks:
+            merge_stats(total, run_batch(task))
+        return total
+
+    with multiprocessing.Pool(jobs, initializer=_init_worker,
+                              initargs=(player_deck_path, enemy_deck_path)) as pool:
+        for part in pool.imap_unordered(run_batch, tasks):
+            merge_stats(total, part)
+    return total
+
+def summarize(stats, card_names=None):
+    """将统计结果整理为可序列化的字典"""
+    card_names = card_names or {}
+    matches = max(1, stats["matches"])
+    return {
+        "matches": stats["matches"],
+        "win_rate": {side: stats["wins"][side] / matches for side in ("player", "enemy", "draw")},
+        "avg_turns": stats["turns"] / matches,
+        "damage_per_card": {
+            card_id: {"name": card_names.get(card_id, card_id), "damage": dmg, "per_match": dmg / matches}
+            for card_id, dmg in stats["damage"].most_common()
+        },
+        "skill_triggers": dict(stats["skills"].most_common()),
+    }
+
+def print_summary(summary, elapsed):
+    rate = summary["win_rate"]
+    print(f"对局数: {summary['matches']}  用时: {elapsed:.1f}s "
+          f"({summary['matches'] / max(elapsed, 1e-9):.0f} 局/秒)")
+    print(f"胜率: 玩家 {rate['player']:.2%}  敌人 {rate['enemy']:.2%}  平局 {rate['draw']:.2%}")
+    print(f"平均回合数: {summary['avg_turns']:.2f}")
+    print("卡牌场均伤害:")
+    for card_id, info in summary["damage_per_card"].items():
+        print(f"  {info['name']:<16} {card_id:<24} {info['per_match']:.2f}")
+    print("技能触发次数:")
+    for name, count in summary["skill_triggers"].items():
+        print(f"  {name:<16} {count}")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="卡组 AI 对战蒙特卡洛模拟")
+    parser.add_argument("player_deck", help="玩家卡组 json 路径")
+    parser.add_argument("enemy_deck", help="敌人卡组 json 路径")
+    parser.add_argument("-n", "--matches", type=int, default=DEFAULT_MATCHES, help="对局数")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="进程数（默认 CPU 核数）")
+    parser.add_argument("--seed", type=int, default=0, help="基础随机种子")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="每个任务的对局数")
+    parser.add_argument("--max-turns", type=int, default=DEFAULT_MAX_TURNS, help="单局最大行动次数")
+    parser.add_argument("--json", dest="json_path", default=None, help="将统计结果写入 json 文件")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    player_deck = os.path.abspath(args.player_deck)
+    enemy_deck = os.path.abspath(args.enemy_deck)
+    _ensure_working_directory()
+
+    from utils.deck_manager import load_deck_cards
+    card_names = {}
+    for path in (player_deck, enemy_deck):
+        cards = load_deck_cards(path)
+        if not cards:
+            print(f"[Simulate] 卡组为空: {path}")
+            return 1
+        card_names.update({card.card_id: card.name for card in cards})
+
+    start = time.perf_counter()
+    stats = simulate(player_deck, enemy_deck, matches=args.matches, jobs=args.jobs,
+                     seed=args.seed, batch_size=args.batch_size, max_turns=args.max_turns)
+    summary = summarize(stats, card_names)
+    print_summary(summary, time.perf_counter() - start)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        print(f"统计结果已保存: {args.json_path}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
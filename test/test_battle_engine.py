@@ -0,0 +1,77 @@
+"""
+测试无界面战斗引擎
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.card_database import CardData
+from game.battle_engine import BattleEngine
+from game.skills.skill_base import SkillTrigger
+
+
+def _make_deck(prefix, traits_list):
+    return [
+        CardData(f"{prefix}_{i:03d}", f"{prefix}{i}", "A", atk=2, hp=3, cd=1, traits=list(traits))
+        for i, traits in enumerate(traits_list)
+    ]
+
+
+def _play_out(seed, max_turns=200):
+    random.seed(seed)
+    player = _make_deck("P", [["火球1"], ["防御1"], ["反击1"], ["吸血1"], []] * 2)
+    enemy = _make_deck("E", [["飞行"], ["治愈1"], ["不死"], ["沉默"], []] * 2)
+    engine = BattleEngine.new_battle(player, enemy, rng=random.Random(seed))
+    turns = 0
+    while not engine.state.game_over and turns < max_turns:
+        engine.run_turn()
+        turns += 1
+    return engine, turns
+
+
+def test_battle_finishes():
+    engine, turns = _play_out(7)
+    assert engine.state.game_over
+    assert engine.state.winner in ("player", "enemy")
+    kinds = {event.kind for event in engine.events}
+    assert {"draw", "play", "deploy", "attack", "game_over"} <= kinds
+
+
+def test_battle_is_deterministic_with_seed():
+    first, first_turns = _play_out(11)
+    second, second_turns = _play_out(11)
+    assert first_turns == second_turns
+    assert first.state.winner == second.state.winner
+    assert [(e.kind, e.owner) for e in first.events] == [(e.kind, e.owner) for e in second.events]
+
+
+def test_flying_defender_redirects_damage():
+    engine = BattleEngine(
+        _make_deck("P", [[]]),
+        _make_deck("E", [["飞行"]]),
+        rng=random.Random(0),
+    )
+    attacker = engine.player_battle_slots[0]
+    defender = engine.enemy_battle_slots[0]
+    attacker.set_card(engine.player_deck.pop())
+    defender.set_card(engine.enemy_deck.pop())
+    engine.execute_attack(attacker, defender, "enemy")
+    assert defender.card_data.hp == 3
+    assert engine.state.sides["enemy"].current_hp == 18
+
+
+def test_trigger_listeners_follow_battle_slots():
+    engine = BattleEngine(
+        _make_deck("P", [["防御1"]]),
+        _make_deck("E", [[]]),
+        rng=random.Random(0),
+    )
+    slot = engine.player_battle_slots[2]
+    assert not engine.has_listeners(SkillTrigger.ON_DAMAGED)
+    slot.set_card(engine.player_deck.pop())
+    assert engine.listeners[SkillTrigger.ON_DAMAGED] == {slot}
+    assert not engine.has_listeners(SkillTrigger.BEFORE_ATTACK)
+    slot.remove_card()
+    assert not engine.has_listeners(SkillTrigger.ON_DAMAGED)
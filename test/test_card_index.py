@@ -0,0 +1,44 @@
+"""
+测试卡牌数据库的二级索引与组合查询
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.card_database import CardData, CardDatabase
+
+
+class MemoryDatabase(CardDatabase):
+    SNAPSHOT_PATH = None
+
+    def load_all(self):
+        pass
+
+
+def _database():
+    db = MemoryDatabase()
+    db.add_card(CardData("A_001", "火焰术士", "A", atk=5, hp=3, cd=1, traits=["火球1"]))
+    db.add_card(CardData("A_002", "火焰骑士", "A", atk=2, hp=6, cd=2, traits=["嘲讽"]))
+    db.add_card(CardData("S_001", "冰霜法师", "S", atk=7, hp=4, cd=3, traits=["火球1", "嘲讽"]))
+    db.add_card(CardData("#elna_001", "艾尔娜", "#elna", atk=1, hp=1, cd=0))
+    return db
+
+
+def test_composed_queries():
+    db = _database()
+    assert [c.card_id for c in db.get_cards_by_level(3)] == ["A_001", "A_002"]
+    assert db.query().trait("火球1", "嘲讽").ids() == ["S_001"]
+    assert db.query().any_trait("火球1", "嘲讽").atk(max_value=5).ids() == ["A_001", "A_002"]
+    assert db.query().hp(min_value=3, max_value=4).ids() == ["A_001", "S_001"]
+    assert db.query().name_prefix("火焰").ids() == ["A_001", "A_002"]
+    assert db.query().event(False).count() == 3
+    assert db.query().event().ids() == ["#elna_001"]
+
+
+def test_update_card_refreshes_index():
+    db = _database()
+    db.update_card("A_002", atk=9, traits=["火球1"])
+    assert db.query().atk(min_value=8).ids() == ["A_002"]
+    assert db.query().trait("嘲讽").ids() == ["S_001"]
+    assert [c.card_id for c in db.get_cards_by_trait("火球1")] == ["A_001", "A_002", "S_001"]
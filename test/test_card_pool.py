@@ -0,0 +1,37 @@
+"""
+测试卡池索引
+"""
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.card_database import CardDatabase, CardData
+from utils.card_pool import CardPoolIndex
+
+
+def _write_cards(base, rarity, ids):
+    os.makedirs(os.path.join(base, rarity), exist_ok=True)
+    with open(os.path.join(base, rarity, "cards.json"), "w", encoding="utf-8") as f:
+        json.dump([{"id": cid, "name": f"卡{cid}", "atk": 1, "hp": 1, "cd": 1} for cid in ids], f)
+
+
+def test_pool_index_tracks_database(tmp_path):
+    base = str(tmp_path)
+    _write_cards(base, "A", ["001", "002"])
+
+    class TempDatabase(CardDatabase):
+        BASE_PATH = base
+        SNAPSHOT_PATH = None
+
+    index = CardPoolIndex(TempDatabase())
+    assert index.get_paths("A") == ("assets/outputs/A/001.png", "assets/outputs/A/002.png")
+    assert index.get_cards_for(["A", "S"]) is index.get_cards_for(["A", "S"])
+
+    index.db.add_card(CardData("S_001", "新卡", "S", image_path="assets/outputs/S/001.png"))
+    assert [card.card_id for card in index.get_cards("S")] == ["S_001"]
+
+    _write_cards(base, "B", ["001"])
+    assert index.refresh_if_changed(force_check=True)
+    assert len(index.get_cards("B")) == 1
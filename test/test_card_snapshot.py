@@ -0,0 +1,41 @@
+"""
+测试卡牌数据库快照缓存
+"""
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.card_database import CardDatabase
+
+
+def _write_cards(base, rarity, cards):
+    os.makedirs(os.path.join(base, rarity), exist_ok=True)
+    with open(os.path.join(base, rarity, "cards.json"), "w", encoding="utf-8") as f:
+        json.dump(cards, f)
+
+
+def test_snapshot_roundtrip_and_invalidation(tmp_path, capsys):
+    base = str(tmp_path / "outputs")
+    _write_cards(base, "A", [{"id": "001", "name": "甲", "atk": 2, "hp": 3, "cd": 1, "traits": ["火球1"]}])
+
+    class TempDatabase(CardDatabase):
+        BASE_PATH = base
+        SNAPSHOT_PATH = str(tmp_path / "cache" / "cards.pkl")
+
+    first = TempDatabase()
+    assert os.path.exists(TempDatabase.SNAPSHOT_PATH)
+    capsys.readouterr()
+
+    warm = TempDatabase()
+    assert "快照" in capsys.readouterr().out
+    card = warm.get_card("A_001")
+    assert (card.name, card.atk, card.traits) == ("甲", 2, ["火球1"])
+    assert warm.get_card_by_path("assets/outputs/A/001.png") is card
+    assert [c.card_id for c in warm.get_cards_by_rarity("A")] == [c.card_id for c in first.get_cards_by_rarity("A")]
+
+    _write_cards(base, "A", [{"id": "001", "name": "乙", "atk": 5, "hp": 5, "cd": 2}])
+    changed = TempDatabase()
+    assert "快照" not in capsys.readouterr().out
+    assert changed.get_card("A_001").name == "乙"
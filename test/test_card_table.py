@@ -0,0 +1,36 @@
+"""
+测试 CardData 复制与列式卡牌表
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.card_database import CardData
+from utils.card_table import CardTable
+
+
+def _cards():
+    return [
+        CardData("A_001", "甲", "A", atk=5, hp=3, cd=1, traits=["火球1"]),
+        CardData("A_002", "乙", "A", atk=2, hp=6, cd=2),
+        CardData("S_001", "丙", "S", atk=7, hp=4, cd=3, traits=["火球1"]),
+    ]
+
+
+def test_card_copy_is_independent():
+    card = _cards()[0]
+    clone = card.copy()
+    clone.hp -= 2
+    clone.traits.append("复活")
+    assert card.hp == 3 and card.traits == ["火球1"]
+    assert clone.max_hp == 3 and clone.card_id == "A_001"
+
+
+def test_vectorized_queries():
+    table = CardTable(_cards(), version=7)
+    assert len(table) == 3 and table.version == 7
+    assert table.select(table.atk > table.hp) == ["A_001", "S_001"]
+    assert table.select(table.has_trait("火球1") & table.rarity_in("S")) == ["S_001"]
+    assert table.traits[0] is table.traits[2]
+    assert table.index_of("A_002") == 1 and table.index_of("X") is None
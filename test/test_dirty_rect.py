@@ -0,0 +1,45 @@
+"""
+测试脏矩形协议
+"""
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from scenes.base.base_scene import BaseScene
+from ui.dirty_rect import DirtyTracker
+
+
+class StaticScene(BaseScene):
+    supports_dirty_rects = True
+
+    def handle_event(self, event):
+        pass
+
+    def update(self, dt):
+        pass
+
+    def draw(self):
+        pass
+
+
+def test_tracker_reports_union_of_old_and_new_area():
+    tracker = DirtyTracker()
+    assert tracker.check(("idle",), (0, 0, 10, 10)) == pygame.Rect(0, 0, 10, 10)
+    assert tracker.check(("idle",), (0, 0, 10, 10)) is None
+    assert tracker.check(("moved",), (20, 0, 10, 10)) == pygame.Rect(0, 0, 30, 10)
+
+
+def test_scene_dirty_rect_protocol():
+    pygame.font.init()
+    scene = StaticScene(pygame.Surface((100, 100)))
+    scene.enter()
+    assert scene.consume_dirty_rects() is None  # 进入场景后整帧重绘
+    assert scene.consume_dirty_rects() == []    # 静止：无需重绘
+    scene.mark_dirty((5, 5, 10, 10))
+    assert scene.consume_dirty_rects() == [pygame.Rect(5, 5, 10, 10)]
+    scene.mark_dirty((5, 5, 10, 10))
+    scene.mark_dirty()
+    assert scene.consume_dirty_rects() is None
@@ -0,0 +1,28 @@
+"""
+测试字体注册表与文字缓存
+"""
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from utils.font_cache import FontRegistry, TextCache
+
+
+def test_fonts_shared_and_text_cached():
+    pygame.font.init()
+    registry = FontRegistry()
+    font = registry.get(None, 20)
+    assert registry.get(None, 20) is font
+    assert registry.get(None, 20, bold=True) is not font
+
+    cache = TextCache(max_entries=2)
+    first = cache.render(font, "FPS: 60", True, (150, 150, 150))
+    assert cache.render(font, "FPS: 60", True, [150, 150, 150]) is first
+    cache.render(font, "a", True, (0, 0, 0))
+    cache.render(font, "b", True, (0, 0, 0))  # 淘汰最久未使用的 "FPS: 60"
+    assert cache.render(font, "FPS: 60", True, (150, 150, 150)) is not first
+    info = cache.info()
+    assert info["hits"] == 1 and info["misses"] == 4 and info["entries"] == 2
@@ -0,0 +1,37 @@
+"""
+测试自适应帧调度
+"""
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+from utils.frame_scheduler import FrameScheduler
+
+
+def test_idle_throttling_and_wakeup():
+    pygame.display.init()
+    scheduler = FrameScheduler(pygame.time.Clock(), active_fps=120, idle_fps=20, idle_delay=0.0)
+    scheduler.tick(animating=True)
+    assert not scheduler.idle
+    dt = scheduler.tick(animating=False)
+    assert scheduler.idle and dt <= 1.5 / 20
+
+    pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a))
+    scheduler.tick(animating=False)  # 有事件时立即返回
+    events = scheduler.get_events()
+    assert any(event.type == pygame.KEYDOWN for event in events)
+    scheduler.idle_delay = 10.0
+    scheduler.tick(animating=False)
+    assert not scheduler.idle  # 输入后恢复全速
+    pygame.display.quit()
+
+
+def test_percentiles():
+    scheduler = FrameScheduler(pygame.time.Clock(), active_fps=60)
+    assert scheduler.percentiles() == {50: 0.0, 95: 0.0, 99: 0.0}
+    scheduler.frame_times.extend(range(1, 101))
+    result = scheduler.percentiles((50, 99))
+    assert 50 <= result[50] <= 51 and result[99] > 98
@@ -0,0 +1,50 @@
+"""
+测试库存的计数存储与变更日志
+"""
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import inventory as inventory_module
+from utils.inventory import Inventory
+
+
+def _use_tmp_files(monkeypatch, tmp_path):
+    monkeypatch.setattr(inventory_module, "SAVE_FILE", str(tmp_path / "inventory.json"))
+    monkeypatch.setattr(inventory_module, "JOURNAL_FILE", str(tmp_path / "inventory.journal"))
+
+
+def test_journal_roundtrip_and_compaction(monkeypatch, tmp_path):
+    _use_tmp_files(monkeypatch, tmp_path)
+    monkeypatch.setattr(inventory_module, "COMPACT_THRESHOLD", 5)
+    inv = Inventory()
+    inv.add_cards([("a\\1.png", "A"), ("a/1.png", "A"), ("s/1.png", "S")])
+    assert inv.remove_cards("a/1.png", 5) == 2
+    inv.save()
+    assert os.path.getsize(inventory_module.JOURNAL_FILE) > 0
+
+    reloaded = Inventory()
+    assert reloaded.get_unique_cards() == [{"path": "s/1.png", "rarity": "S", "count": 1}]
+    assert reloaded.get_collection_stats()["total_cards"] == 1
+
+    reloaded.add_cards([("b/1.png", "B")] * 3)  # 超过阈值，压缩为快照
+    assert os.path.getsize(inventory_module.JOURNAL_FILE) == 0
+    again = Inventory()
+    assert [card["count"] for card in again.get_cards_by_rarity("B")] == [3]
+    assert again.rarity_stats["A"] == 0 and again.total_draws == 4
+
+
+def test_loads_legacy_card_list(monkeypatch, tmp_path):
+    _use_tmp_files(monkeypatch, tmp_path)
+    legacy = {
+        "cards": [{"path": "a/1.png", "rarity": "A"}, {"path": "a/1.png", "rarity": "A"}],
+        "total_draws": 2,
+        "rarity_stats": {"A": 2},
+    }
+    with open(inventory_module.SAVE_FILE, "w", encoding="utf-8") as f:
+        json.dump(legacy, f)
+    inv = Inventory()
+    assert inv.get_unique_cards() == [{"path": "a/1.png", "rarity": "A", "count": 2}]
+    assert inv.remove_card("a/1.png") and inv.total_draws == 1
@@ -0,0 +1,34 @@
+"""
+测试稀有度别名表抽样
+"""
+import os
+import random
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from scenes.gacha.gacha_probabilities import holiday_prob
+from utils.rarity_sampler import AliasTable, get_sampler, weighted_choice
+
+
+def test_alias_table_matches_float_weights():
+    table = AliasTable(holiday_prob)
+    total = sum(holiday_prob.values())
+    for rarity, p in table.probabilities.items():
+        assert abs(p - holiday_prob[rarity] / total) < 1e-12
+
+    counts = table.counts(200000, rng=np.random.default_rng(1))
+    assert sum(counts.values()) == 200000
+    assert abs(counts["B"] / 200000 - holiday_prob["B"] / total) < 0.01
+
+
+def test_draw_is_seeded_and_skips_zero_weights():
+    sampler = get_sampler({"SSS": 0.5, "A": 0, "D": 99.5})
+    assert "A" not in sampler.keys
+    first = [sampler.draw(random.Random(3)) for _ in range(5)]
+    second = [sampler.draw(random.Random(3)) for _ in range(5)]
+    assert first == second
+    assert weighted_choice({"A": 0}) is None
+    assert get_sampler("special") is get_sampler("special")
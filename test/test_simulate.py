@@ -0,0 +1,35 @@
+"""
+测试批量对战模拟
+"""
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from simulate import simulate, summarize
+
+
+def _write_deck(path, prefix, count):
+    entries = [
+        {"path": f"assets/outputs/A/{prefix}{i}.png", "rarity": "A", "name": f"{prefix}{i}",
+         "atk": 2, "hp": 3, "cd": 1}
+        for i in range(count)
+    ]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"deck": entries}, f)
+    return str(path)
+
+
+def test_simulate_is_reproducible_across_jobs(tmp_path):
+    player = _write_deck(tmp_path / "p.json", "P", 8)
+    enemy = _write_deck(tmp_path / "e.json", "E", 6)
+    serial = simulate(player, enemy, matches=40, jobs=1, seed=3, batch_size=10)
+    pooled = simulate(player, enemy, matches=40, jobs=2, seed=3, batch_size=10)
+    assert serial["matches"] == pooled["matches"] == 40
+    assert serial["wins"] == pooled["wins"]
+    assert serial["damage"] == pooled["damage"]
+
+    summary = summarize(serial)
+    assert abs(sum(summary["win_rate"].values()) - 1.0) < 1e-9
+    assert summary["avg_turns"] > 0
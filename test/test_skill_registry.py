@@ -0,0 +1,37 @@
+"""
+测试技能注册表的trait缓存
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.card_database import CardData
+from game.skills.skill_registry import get_skill_registry
+
+
+def test_trait_skill_is_cached():
+    registry = get_skill_registry()
+    registry.clear_cache()
+    first = registry.get_skill_by_trait("群体火球3")
+    second = registry.get_skill_by_trait("群体火球3")
+    assert first is second
+    assert first.name == "群体火球3"
+    assert registry.get_skill_by_trait("飞行") is None
+    assert registry.cache_info()["hits"] == 1
+    assert registry.cache_info()["misses"] == 2
+
+
+def test_card_skills_follow_traits():
+    registry = get_skill_registry()
+    card = CardData("A_001", "测试", "A", traits=["火球2"])
+    other = CardData("A_002", "测试2", "A", traits=["火球2"])
+    skills = registry.get_card_skills(card)
+    assert registry.get_card_skills(card) is skills
+    # 每张卡拥有独立的效果对象
+    assert skills[0].effects[0] is not registry.get_card_skills(other)[0].effects[0]
+
+    card.traits.append("防御1")
+    assert [s.name for s in registry.get_card_skills(card)] == ["火球2", "防御1"]
+    card.traits = ["沉默"]
+    assert [s.name for s in registry.get_card_skills(card)] == ["沉默"]
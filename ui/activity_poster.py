@@ -17,6 +17,7 @@ import os
 import pygame
 from typing import Callable, List, Optional, Tuple
 from config import WINDOW_WIDTH, WINDOW_HEIGHT
+from ui.dirty_rect import DirtyTracker
 
 # 路径
 posters_dir = os.path.join("assets", "poster")
@@ -64,6 +65,7 @@ class PosterUI:
         # 坐标
         self._topleft = (0, 0)
         self._rect = pygame.Rect(0, 0, self.width, self.height)
+        self._dirty = DirtyTracker()
 
         # poster 数据
         self.poster_paths: List[str] = []
@@ -261,6 +263,14 @@ class PosterUI:
 
         surface.blit(poster_layer, (x + inner_x, y + inner_y))
 
+    def is_animating(self):
+        return self._is_animating
+
+    def get_dirty_rect(self):
+        """轮播切换或滑动动画时返回海报区域，否则返回 None"""
+        state = (tuple(self._rect), self.current_index, self._is_animating, round(self._anim_progress, 3))
+        return self._dirty.check(state, self._rect)
+
     # ---------- playback轮播控制 ----------
     def play(self):
         self._playing = True
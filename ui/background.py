@@ -32,6 +32,11 @@ class ParallaxBackground:
         self.offset_x += (self.target_offset_x - self.offset_x) * 5 * dt
         self.offset_y += (self.target_offset_y - self.offset_y) * 5 * dt
 
+    def is_animating(self):
+        """视差偏移是否仍在向目标移动（半像素以内视为静止）"""
+        return (abs(self.target_offset_x - self.offset_x) > 0.5
+                or abs(self.target_offset_y - self.offset_y) > 0.5)
+
     def update_mouse_position(self, mouse_pos):
         """根据鼠标位置更新视差偏移"""
         center_x = self.width / 2
@@ -40,14 +45,19 @@ class ParallaxBackground:
         self.target_offset_x = ((mouse_pos[0] - center_x) / center_x) * max_offset
         self.target_offset_y = ((mouse_pos[1] - center_y) / center_y) * max_offset
         
-    def draw(self, screen):
-        """绘制带视差效果的背景"""
+    def view_origin(self):
+        """当前绘制区域在视差表面上的左上角（像素），未变化时画面不变"""
         src_x = int((self.parallax_width - self.width) / 2 - self.offset_x)
         src_y = int((self.parallax_height - self.height) / 2 - self.offset_y)
         
         # 确保不超出边界
         src_x = max(0, min(src_x, self.parallax_width - self.width))
         src_y = max(0, min(src_y, self.parallax_height - self.height))
+        return src_x, src_y
+
+    def draw(self, screen):
+        """绘制带视差效果的背景"""
+        src_x, src_y = self.view_origin()
         
         # 绘制视差表面的部分区域
         screen.blit(self.parallax_surface, (0, 0), 
@@ -0,0 +1,22 @@
+"""脏矩形辅助：控件比较每帧的绘制状态，变化时给出需要重绘的区域"""
+import pygame
+
+class DirtyTracker:
+    """记录控件上一次绘制时的状态与区域"""
+    def __init__(self):
+        self._state = None
+        self._rect = None
+
+    def check(self, state, rect):
+        """状态变化时返回需重绘区域（新旧区域的并集），否则返回 None"""
+        if state == self._state and self._rect is not None:
+            return None
+        rect = pygame.Rect(rect)
+        previous = self._rect
+        self._state = state
+        self._rect = rect
+        return rect.union(previous) if previous is not None else rect.copy()
+
+    def reset(self):
+        """下次检查时必定视为变化"""
+        self._state = None
@@ -2,6 +2,7 @@
 import pygame
 import math
 from config import UI_SCALE, get_font
+from ui.dirty_rect import DirtyTracker
 
 class MenuButton:
     def __init__(self, x, y, width, height, text,
@@ -38,6 +39,7 @@ class MenuButton:
         
         # Triangle size
         self.triangle_size = int(20 * UI_SCALE)
+        self._dirty = DirtyTracker()
         
     def update_position(self, x, y, width=None, height=None):
         """Update button position"""
@@ -48,6 +50,19 @@ class MenuButton:
         self.rect = pygame.Rect(x, y, width, height)
         self.text_rect = self.text_surface.get_rect(center=self.rect.center)
         
+    def is_animating(self):
+        """Glow pulses while hovered (or always with persistent glow) and fades in/out"""
+        if self.persistent_glow or self.is_hovered:
+            return True
+        return self.hover_alpha > 0
+
+    def get_dirty_rect(self):
+        """Return the area to redraw if the visual state changed since the last check"""
+        state = (tuple(self.rect), self.is_hovered, int(self.hover_alpha), round(self.glow_intensity, 2))
+        # Glow extends 20px around the button, triangles extend tri_width to the sides
+        padding_x = max(20, int(60 * UI_SCALE))
+        return self._dirty.check(state, self.rect.inflate(padding_x * 2, 40))
+
     def handle_event(self, event):
         """Handle events"""
         if event.type == pygame.MOUSEMOTION:
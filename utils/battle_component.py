@@ -3,6 +3,7 @@ import pygame
 from config import *
 from game.card_animation import ShakeAnimation
 from utils.image_cache import get_scaled_image
+from ui.dirty_rect import DirtyTracker
 
 STATE_FONT_SIZE = int(60 * UI_SCALE)
 STATE_X_OFFSET = int(20 * UI_SCALE)
@@ -35,6 +36,7 @@ class CardSlot:
         self._empty_slot_cache = None
         self._cd_cache = {}  # CD text and backgrounds
         self._stats_cache = {}  # ATK/HP text
+        self._dirty = DirtyTracker()
 
     def set_card(self, card_data):
         """
@@ -265,6 +267,25 @@ class CardSlot:
             screen.blit(hp_data['outline'], (hp_pos[0] + dx, hp_pos[1] + dy))
         screen.blit(hp_data['surface'], hp_pos)
 
+    def is_animating(self):
+        return bool(self.shake_animation or self.hp_flash_animation or self.current_animation)
+
+    def get_dirty_rect(self):
+        """绘制状态变化时返回需重绘区域（含上方 CD 指示器与震动范围），否则返回 None"""
+        if self.shake_animation or self.hp_flash_animation:
+            self._dirty.reset()  # 动画期间每帧重绘
+        card = self.card_data
+        state = (
+            tuple(self.rect), id(card), id(getattr(self, "card_image", None)),
+            getattr(card, "atk", None), getattr(card, "hp", None),
+            self.cd_remaining, self.is_hovered, self.is_highlighted,
+        )
+        padding = int(20 * UI_SCALE)
+        bounds = self.rect.inflate(padding * 2, padding * 2)
+        bounds.top -= int(50 * UI_SCALE)
+        bounds.height += int(50 * UI_SCALE)
+        return self._dirty.check(state, bounds)
+
     def start_shake_animation(self, duration=0.4, intensity=5):
         """开始震动动画"""
         self.shake_animation = ShakeAnimation(self, duration, intensity)
@@ -295,6 +316,7 @@ class HealthBar:
         self.current_hp = current_hp
         self.is_player = is_player
         self.animated_hp = current_hp # 动画当前血量（用于平滑过渡）
+        self._dirty = DirtyTracker()
         
     def set_hp(self, hp):
         """设置血量"""
@@ -306,6 +328,16 @@ class HealthBar:
         diff = self.current_hp - self.animated_hp
         self.animated_hp += diff * min(1.0, dt * 5)
         
+    def is_animating(self):
+        return abs(self.current_hp - self.animated_hp) > 0.01 * max(1, self.max_hp)
+
+    def get_dirty_rect(self):
+        """血量或动画进度变化时返回需重绘区域，否则返回 None"""
+        hp_width = int(self.rect.width * self.animated_hp / self.max_hp) if self.max_hp else 0
+        state = (tuple(self.rect), int(self.current_hp), self.max_hp, hp_width)
+        padding = int(6 * UI_SCALE) + 2
+        return self._dirty.check(state, self.rect.inflate(padding, padding))
+
     def draw(self, screen):
         """绘制血量条"""
         # 半透明背景
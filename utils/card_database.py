@@ -3,7 +3,11 @@
 """
 import json
 import os
+import pickle
 from collections import defaultdict
+from utils.card_index import CardIndex, CardQuery
+
+SNAPSHOT_VERSION = 2  # CardData 结构变化时递增，使旧快照失效
 
 """卡牌数据类"""
 class CardData:
@@ -22,6 +26,12 @@ class CardData:
         "D": 6,
         "#elna": 0,
     }
+    # 固定属性（减少大量卡牌时的内存占用）；_revive_consumed 为战斗中的复活标记
+    __slots__ = (
+        "card_id", "name", "rarity", "level", "atk", "hp", "max_hp", "cd",
+        "_traits", "description", "image_path", "is_event_card",
+        "_skill_cache", "_revive_consumed",
+    )
     
     def __init__(self, card_id, name, rarity, atk=0, hp=0, cd=0, traits=None, description="", image_path="", level_override=None):
         self.card_id = card_id
@@ -36,6 +46,35 @@ class CardData:
         self.description = description
         self.image_path = image_path
         self.is_event_card = rarity.startswith("#")
+
+    @property
+    def traits(self):
+        return self._traits
+
+    @traits.setter
+    def traits(self, value):
+        self._traits = value
+        self._skill_cache = None  # 技能列表缓存（由技能注册表生成），traits变化时失效
+
+    def __getstate__(self):
+        # 复制/序列化时不携带技能缓存（效果对象可能引用场景中的槽位）
+        state = {name: getattr(self, name) for name in self.__slots__ if hasattr(self, name)}
+        state["_skill_cache"] = None
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def copy(self):
+        """创建独立的卡牌实例（战斗中会修改 hp/atk/traits），比 deepcopy 快得多"""
+        clone = object.__new__(type(self))
+        for name in self.__slots__:
+            if hasattr(self, name):
+                object.__setattr__(clone, name, getattr(self, name))
+        clone._traits = list(self._traits)
+        clone._skill_cache = None
+        return clone
     
     def to_dict(self):
         """转换为字典（用于保存）"""
@@ -91,15 +130,35 @@ class CardDatabase:
         "A+", "A", "B+", "B", "C+", "C", "D"
     ]
     EVENT_DIRS = ["#elna"]
+    SNAPSHOT_PATH = os.path.join("data", "cache", "card_database.pkl")  # 编译快照，None 表示禁用
     
     def __init__(self):
         self.cards = {}  # {card_id: CardData}
         self.cards_by_rarity = defaultdict(list)  # {rarity: [CardData]}
         self.path_to_id_map = {}  # {image_path: card_id}
+        self.index = CardIndex()  # trait/等级/数值/名称 二级索引
+        self.version = 0  # 卡牌数据变化计数（供卡池、列式表等索引判断是否需要重建）
+        self._table = None
         self.load_all() # 加载所有目录的卡牌
     
+    def _clear(self):
+        self.cards = {}
+        self.cards_by_rarity = defaultdict(list)
+        self.path_to_id_map = {}
+        self.index = CardIndex()
+
+    def reload(self):
+        """清空并重新加载所有卡牌"""
+        self._clear()
+        self.load_all()
+
     def load_all(self):
-        """加载所有稀有度目录下的卡牌"""
+        """加载所有稀有度目录下的卡牌（cards.json 未变化时直接读取快照）"""
+        signature = self._source_signature()
+        if self._load_snapshot(signature):
+            print(f"卡牌数据库已加载: {len(self.cards)} 张卡牌（快照）")
+            return
+
         total_loaded = 0
         
         for rarity in self.RARITY_DIRS + self.EVENT_DIRS:
@@ -108,8 +167,50 @@ class CardDatabase:
         
         if total_loaded > 0:
             print(f"卡牌数据库已加载: {total_loaded} 张卡牌")
+            self._save_snapshot(signature)
         else:
             print("警告: 未加载任何卡牌，请检查目录结构和 cards.json 文件")
+
+    def _source_signature(self):
+        """所有 cards.json 的 (稀有度, 修改时间, 大小)，用于判断快照是否过期"""
+        entries = []
+        for rarity in self.RARITY_DIRS + self.EVENT_DIRS:
+            try:
+                stat = os.stat(os.path.join(self.BASE_PATH, rarity, "cards.json"))
+                entries.append((rarity, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                entries.append((rarity, None, None))
+        return (SNAPSHOT_VERSION, os.path.abspath(self.BASE_PATH), tuple(entries))
+
+    def _load_snapshot(self, signature):
+        if not self.SNAPSHOT_PATH or not os.path.exists(self.SNAPSHOT_PATH):
+            return False
+        try:
+            with open(self.SNAPSHOT_PATH, "rb") as f:
+                snapshot = pickle.load(f)
+            if snapshot.get("signature") != signature:
+                return False
+            for card in snapshot["cards"]:
+                self.add_card(card)
+            return True
+        except Exception as e:
+            print(f"读取卡牌快照失败，改为解析 cards.json: {e}")
+            self._clear()
+            return False
+
+    def _save_snapshot(self, signature):
+        if not self.SNAPSHOT_PATH:
+            return
+        tmp_path = self.SNAPSHOT_PATH + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.SNAPSHOT_PATH) or ".", exist_ok=True)
+            cards = [card for rarity_cards in self.cards_by_rarity.values() for card in rarity_cards]
+            with open(tmp_path, "wb") as f:
+                pickle.dump({"signature": signature, "cards": cards}, f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.SNAPSHOT_PATH)
+        except Exception as e:
+            print(f"保存卡牌快照失败: {e}")
     
     def load_rarity_cards(self, rarity):
         cards_json_path = os.path.join(self.BASE_PATH, rarity, "cards.json")
@@ -134,8 +235,10 @@ class CardDatabase:
     
     def add_card(self, card_data):
         """添加卡牌到数据库"""
+        self.version += 1
         self.cards[card_data.card_id] = card_data
         self.cards_by_rarity[card_data.rarity].append(card_data)
+        self.index.add(card_data)
         
         # 建立路径映射
         if card_data.image_path:
@@ -175,6 +278,29 @@ class CardDatabase:
     def get_all_cards(self):
         """获取所有卡牌"""
         return list(self.cards.values())
+
+    def query(self):
+        """创建组合查询，例: db.query().trait("火球1").atk(min_value=3).cards()"""
+        return CardQuery(self)
+
+    def get_cards_by_level(self, level):
+        """获取指定等级的所有卡牌"""
+        return self.query().level(level).cards()
+
+    def get_cards_by_trait(self, trait):
+        """获取拥有指定 trait 的所有卡牌"""
+        return self.query().trait(trait).cards()
+
+    def find_cards_by_name(self, prefix):
+        """获取名称以 prefix 开头的所有卡牌"""
+        return self.query().name_prefix(prefix).cards()
+
+    def get_table(self):
+        """获取列式只读卡牌表（数据变化后自动重建）"""
+        from utils.card_table import CardTable
+        if self._table is None or self._table.version != self.version:
+            self._table = CardTable(self.cards.values(), version=self.version)
+        return self._table
     
     def save_rarity_cards(self, rarity):
         cards_json_path = os.path.join(self.BASE_PATH, rarity, "cards.json")
@@ -212,6 +338,8 @@ class CardDatabase:
             for key, value in kwargs.items():
                 if hasattr(card, key):
                     setattr(card, key, value)
+            self.index.add(card)  # 按新数值刷新索引
+            self.version += 1
             print(f"卡牌 {card_id} 已更新")
             return True
         return False
@@ -0,0 +1,173 @@
+"""
+卡牌二级索引与组合查询：按 trait、等级、数值区间（atk/hp/cd）、名称前缀检索，
+由 CardDatabase 在 add_card / update_card 时增量维护
+例: db.query().trait("火球1").atk(min_value=3).level(3).cards()
+"""
+from bisect import bisect_left, bisect_right, insort
+
+_MAX_ID = "\U0010ffff"  # 大于任何 card_id，区间查询时用于包含上界
+_EMPTY = frozenset()
+
+class CardIndex:
+    """CardDatabase 的二级索引"""
+    STAT_FIELDS = ("atk", "hp", "cd")
+
+    def __init__(self):
+        self.order = {}        # {card_id: 加入顺序}，查询结果按此排序
+        self.by_trait = {}     # {trait: {card_id}}
+        self.by_level = {}     # {level: {card_id}}
+        self.by_rarity = {}    # {rarity: {card_id}}
+        self.events = set()    # 活动卡 card_id
+        self.stats = {field: [] for field in self.STAT_FIELDS}  # {字段: [(值, card_id)] 有序}
+        self.names = []        # [(name, card_id)] 有序，用于前缀查询
+        self._entries = {}     # {card_id: 建立索引时的字段值}，用于增量删除
+        self._counter = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def add(self, card):
+        """加入（或刷新）一张卡牌的索引"""
+        card_id = card.card_id
+        if card_id in self._entries:
+            self.remove(card_id)
+        if card_id not in self.order:
+            self.order[card_id] = self._counter
+            self._counter += 1
+        entry = {
+            "traits": tuple(dict.fromkeys(card.traits or ())),
+            "level": card.level,
+            "rarity": card.rarity,
+            "name": card.name or "",
+            "event": card.is_event_card,
+        }
+        for field in self.STAT_FIELDS:
+            entry[field] = getattr(card, field)
+            insort(self.stats[field], (entry[field], card_id))
+        for trait in entry["traits"]:
+            self.by_trait.setdefault(trait, set()).add(card_id)
+        self.by_level.setdefault(entry["level"], set()).add(card_id)
+        self.by_rarity.setdefault(entry["rarity"], set()).add(card_id)
+        if entry["event"]:
+            self.events.add(card_id)
+        insort(self.names, (entry["name"], card_id))
+        self._entries[card_id] = entry
+
+    def remove(self, card_id):
+        """移除一张卡牌的索引"""
+        entry = self._entries.pop(card_id, None)
+        if entry is None:
+            return
+        for field in self.STAT_FIELDS:
+            _remove_sorted(self.stats[field], (entry[field], card_id))
+        for trait in entry["traits"]:
+            _discard(self.by_trait, trait, card_id)
+        _discard(self.by_level, entry["level"], card_id)
+        _discard(self.by_rarity, entry["rarity"], card_id)
+        self.events.discard(card_id)
+        _remove_sorted(self.names, (entry["name"], card_id))
+
+    def all_ids(self):
+        return set(self._entries)
+
+    def stat_range(self, field, min_value=None, max_value=None):
+        """数值字段位于 [min_value, max_value] 区间内的 card_id 集合"""
+        values = self.stats[field]
+        lo = 0 if min_value is None else bisect_left(values, (min_value,))
+        hi = len(values) if max_value is None else bisect_right(values, (max_value, _MAX_ID))
+        return {card_id for _, card_id in values[lo:hi]}
+
+    def name_prefix(self, prefix):
+        """名称以 prefix 开头的 card_id 集合"""
+        lo = bisect_left(self.names, (prefix,))
+        result = set()
+        for name, card_id in self.names[lo:]:
+            if not name.startswith(prefix):
+                break
+            result.add(card_id)
+        return result
+
+
+def _discard(mapping, key, card_id):
+    ids = mapping.get(key)
+    if ids is not None:
+        ids.discard(card_id)
+        if not ids:
+            del mapping[key]
+
+def _remove_sorted(values, item):
+    index = bisect_left(values, item)
+    if index < len(values) and values[index] == item:
+        del values[index]
+
+
+class CardQuery:
+    """可组合的卡牌查询，各条件取交集；cards() / ids() 返回按加入数据库顺序排列的结果"""
+    def __init__(self, db):
+        self.db = db
+        self.index = db.index
+        self._ids = None  # None 表示尚未施加条件（全部卡牌）
+
+    def _narrow(self, ids):
+        if self._ids is None:
+            self._ids = set(ids)
+        else:
+            self._ids &= ids
+        return self
+
+    def trait(self, *traits):
+        """拥有全部给定 trait"""
+        for trait in traits:
+            self._narrow(self.index.by_trait.get(trait, _EMPTY))
+        return self
+
+    def any_trait(self, *traits):
+        """拥有任一给定 trait"""
+        ids = set()
+        for trait in traits:
+            ids |= self.index.by_trait.get(trait, set())
+        return self._narrow(ids)
+
+    def level(self, *levels):
+        ids = set()
+        for level in levels:
+            ids |= self.index.by_level.get(level, set())
+        return self._narrow(ids)
+
+    def rarity(self, *rarities):
+        ids = set()
+        for rarity in rarities:
+            ids |= self.index.by_rarity.get(rarity, set())
+        return self._narrow(ids)
+
+    def event(self, is_event=True):
+        """只保留（或排除）活动卡"""
+        if is_event:
+            return self._narrow(self.index.events)
+        if self._ids is None:
+            self._ids = self.index.all_ids()
+        self._ids -= self.index.events
+        return self
+
+    def atk(self, min_value=None, max_value=None):
+        return self._narrow(self.index.stat_range("atk", min_value, max_value))
+
+    def hp(self, min_value=None, max_value=None):
+        return self._narrow(self.index.stat_range("hp", min_value, max_value))
+
+    def cd(self, min_value=None, max_value=None):
+        return self._narrow(self.index.stat_range("cd", min_value, max_value))
+
+    def name_prefix(self, prefix):
+        return self._narrow(self.index.name_prefix(prefix))
+
+    def ids(self):
+        ids = self.index.all_ids() if self._ids is None else self._ids
+        return sorted(ids, key=self.index.order.__getitem__)
+
+    def cards(self):
+        cards = self.db.cards
+        return [cards[card_id] for card_id in self.ids()]
+
+    def count(self):
+        return len(self.index) if self._ids is None else len(self._ids)
@@ -0,0 +1,108 @@
+"""
+卡池索引：基于 CardDatabase 一次性构建 稀有度 -> 卡牌/图片路径 的只读索引，
+供抽卡、商店、自选、迷宫等共享，避免每次抽取都遍历目录
+"""
+import os
+import time
+from utils.card_database import get_card_database
+
+class CardPoolIndex:
+    """按稀有度组织的卡池索引"""
+    CHECK_INTERVAL = 2.0  # 目录变更检查的最小间隔（秒），避免每次抽卡都访问磁盘
+
+    def __init__(self, db=None):
+        self.db = db or get_card_database()
+        self.by_rarity = {}    # {rarity: (CardData, ...)}
+        self.paths = {}        # {rarity: (image_path, ...)}
+        self.all_cards = ()
+        self._combined = {}    # {(rarity, ...): (CardData, ...)}
+        self._signature = None
+        self._db_version = None
+        self._last_check = 0.0
+        self.rebuild()
+
+    def _directories(self):
+        return [os.path.join(self.db.BASE_PATH, rarity) for rarity in self.db.RARITY_DIRS + self.db.EVENT_DIRS]
+
+    def _compute_signature(self):
+        """各稀有度目录与其 cards.json 的修改时间"""
+        signature = []
+        for directory in self._directories():
+            for path in (directory, os.path.join(directory, "cards.json")):
+                try:
+                    signature.append(os.stat(path).st_mtime_ns)
+                except OSError:
+                    signature.append(None)
+        return tuple(signature)
+
+    def rebuild(self):
+        """根据数据库当前内容重建索引"""
+        by_rarity = {}
+        for card in self.db.get_all_cards():
+            by_rarity.setdefault(card.rarity, []).append(card)
+        self.by_rarity = {rarity: tuple(cards) for rarity, cards in by_rarity.items()}
+        self.paths = {
+            rarity: tuple(card.image_path for card in cards if card.image_path)
+            for rarity, cards in self.by_rarity.items()
+        }
+        self.all_cards = tuple(card for cards in self.by_rarity.values() for card in cards)
+        self._combined = {}
+        self._db_version = self.db.version
+        self._signature = self._compute_signature()
+        self._last_check = time.monotonic()
+
+    def reload(self):
+        """重新加载数据库并重建索引（卡牌文件变化后调用）"""
+        self.db.reload()
+        self.rebuild()
+
+    def refresh_if_changed(self, force_check=False):
+        """数据库新增卡牌时重建索引；目录或 cards.json 修改时间变化时重新加载，返回是否发生了重建"""
+        if self.db.version != self._db_version:
+            self.rebuild()
+            return True
+        now = time.monotonic()
+        if not force_check and now - self._last_check < self.CHECK_INTERVAL:
+            return False
+        self._last_check = now
+        if self._compute_signature() == self._signature:
+            return False
+        print("[CardPool] 检测到卡牌目录变化，重新加载卡池")
+        self.reload()
+        return True
+
+    def get_cards(self, rarity):
+        """获取指定稀有度的卡牌元组"""
+        self.refresh_if_changed()
+        return self.by_rarity.get(rarity, ())
+
+    def get_paths(self, rarity):
+        """获取指定稀有度的卡牌图片路径元组"""
+        self.refresh_if_changed()
+        return self.paths.get(rarity, ())
+
+    def get_cards_for(self, rarities):
+        """获取多个稀有度合并后的卡牌元组（结果缓存）"""
+        self.refresh_if_changed()
+        key = tuple(rarities)
+        combined = self._combined.get(key)
+        if combined is None:
+            combined = tuple(card for rarity in key for card in self.by_rarity.get(rarity, ()))
+            self._combined[key] = combined
+        return combined
+
+    def grouped(self):
+        """{稀有度: 卡牌元组}（仅包含非空稀有度）"""
+        self.refresh_if_changed()
+        return dict(self.by_rarity)
+
+
+# 全局卡池索引实例
+_card_pool_index = None
+
+def get_card_pool_index():
+    """获取全局卡池索引实例"""
+    global _card_pool_index
+    if _card_pool_index is None:
+        _card_pool_index = CardPoolIndex()
+    return _card_pool_index
@@ -0,0 +1,47 @@
+"""
+列式卡牌表：只读目录视图，数值属性存为 NumPy 数组，便于向量化的平衡性查询
+例: table.select(table.atk > table.hp) -> 所有攻击大于血量的卡牌ID
+"""
+import sys
+import numpy as np
+
+class CardTable:
+    """只读列式卡牌目录（修改卡牌请使用 CardDatabase，表会随数据版本自动重建）"""
+    def __init__(self, cards, version=0):
+        cards = list(cards)
+        self.version = version
+        self.card_ids = np.array([card.card_id for card in cards], dtype=object)
+        self.names = np.array([card.name for card in cards], dtype=object)
+        self.rarities = np.array([sys.intern(card.rarity) for card in cards], dtype=object)
+        self.image_paths = np.array([card.image_path for card in cards], dtype=object)
+        self.atk = np.array([card.atk for card in cards], dtype=np.int32)
+        self.hp = np.array([card.max_hp for card in cards], dtype=np.int32)
+        self.cd = np.array([card.cd for card in cards], dtype=np.int32)
+        self.level = np.array([card.level for card in cards], dtype=np.float32)
+
+        # traits 以驻留元组存储，相同组合共享同一对象
+        interned = {}
+        self.traits = np.empty(len(cards), dtype=object)
+        for i, card in enumerate(cards):
+            key = tuple(sys.intern(trait) for trait in (card.traits or ()))
+            self.traits[i] = interned.setdefault(key, key)
+        self._row_of = {card_id: i for i, card_id in enumerate(self.card_ids.tolist())}
+
+    def __len__(self):
+        return len(self.card_ids)
+
+    def index_of(self, card_id):
+        """卡牌ID对应的行号，不存在时返回 None"""
+        return self._row_of.get(card_id)
+
+    def has_trait(self, trait):
+        """拥有指定 trait 的行掩码"""
+        return np.fromiter((trait in traits for traits in self.traits), dtype=bool, count=len(self))
+
+    def rarity_in(self, *rarities):
+        """稀有度属于给定集合的行掩码"""
+        return np.isin(self.rarities, rarities)
+
+    def select(self, mask):
+        """按掩码（或行号数组）返回卡牌ID列表"""
+        return self.card_ids[mask].tolist()
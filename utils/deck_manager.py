@@ -103,6 +103,58 @@ class DeckManager:
         except Exception as e:
             print(f"卡组加载失败: {e}")
 
+def load_deck_entries(json_path):
+    """读取卡组json中的 deck 条目列表"""
+    if not json_path:
+        return []
+    if not os.path.exists(json_path):
+        print(f"[Deck] 未找到卡组文件: {json_path}")
+        return []
+    try:
+        with open(json_path, "r", encoding="utf-8") as fp:
+            data = json.load(fp)
+        return data.get("deck", [])
+    except Exception as err:
+        print(f"[Deck] 读取卡组失败: {json_path} -> {err}")
+        return []
+
+def load_deck_cards(json_path, db=None):
+    """读取卡组json并转换为独立的 CardData 列表（每张均为副本）"""
+    from utils.card_database import get_card_database, CardData
+
+    deck = []
+    db = db or get_card_database()
+    for entry in load_deck_entries(json_path):
+        path = entry.get("path", "")
+        rarity = entry.get("rarity", "C")
+
+        card_data = None
+        try:
+            card_data = db.get_card_by_path(path)
+            if card_data is not None:
+                card_data = card_data.copy() # 复制实例，避免双方卡组引用同一对象！！
+        except Exception as e:
+            print(f"[Deck] db.get_card_by_path 抛出异常: path='{path}', err={e}")
+            card_data = None
+
+        if card_data is None:
+            filename = os.path.splitext(os.path.basename(path))[0]
+            inferred_id = f"{rarity}_{filename}"
+            print(f"[Deck] 在数据库中找不到卡牌 record: path='{path}', inferred_id='{inferred_id}' - 使用 fallback CardData")
+            card_data = CardData(
+                card_id=inferred_id,
+                name=entry.get("name", f"Card {filename}"),
+                rarity=rarity,
+                atk=entry.get("atk", 0),
+                hp=entry.get("hp", 0),
+                cd=entry.get("cd", 0),
+                image_path=path
+            )
+
+        deck.append(card_data)
+
+    return deck
+
 # 全局卡组管理实例
 _deck_manager = None
 
@@ -3,6 +3,8 @@ import json
 import os
 import random
 from utils.card_database import get_card_database
+from utils.rarity_sampler import AliasTable
+from utils.card_pool import get_card_pool_index
 
 CARD_BASE_PATH = "assets/outputs" # 路径
 # 抽卡概率配置
@@ -65,14 +67,9 @@ class DraftManager:
         grouped = {}
 
         if self.card_db:
-            for card in self.card_db.get_all_cards():
-                rarity = card.rarity
-                if not card.image_path:
-                    continue
-                grouped.setdefault(rarity, []).append({
-                    "path": card.image_path.replace('/', os.sep),
-                    "rarity": rarity
-                })
+            for rarity, paths in get_card_pool_index().paths.items():
+                if paths:
+                    grouped[rarity] = [{"path": path.replace('/', os.sep), "rarity": rarity} for path in paths]
         else:
             for rarity in CARD_PROBABILITIES.keys():
                 rarity_path = os.path.join(CARD_BASE_PATH, rarity)
@@ -96,24 +93,19 @@ class DraftManager:
             return []
 
         pools = {rarity: cards.copy() for rarity, cards in cards_by_rarity.items() if cards}
-        rarities = [r for r in CARD_PROBABILITIES if r in pools and CARD_PROBABILITIES[r] > 0]
-        weights = [CARD_PROBABILITIES[r] for r in rarities]
+        weights = {r: CARD_PROBABILITIES[r] for r in CARD_PROBABILITIES if r in pools and CARD_PROBABILITIES[r] > 0}
 
         selected = []
-        while rarities and len(selected) < target:
-            rarity = random.choices(rarities, weights=weights, k=1)[0]
-            pool = pools.get(rarity)
-            if not pool:
-                idx = rarities.index(rarity)
-                rarities.pop(idx)
-                weights.pop(idx)
-                continue
+        sampler = AliasTable(weights) if weights else None
+        while sampler is not None and len(selected) < target:
+            rarity = sampler.draw()
+            pool = pools[rarity]
             card = pool.pop(random.randrange(len(pool)))
             selected.append(card)
             if not pool:
-                idx = rarities.index(rarity)
-                rarities.pop(idx)
-                weights.pop(idx)
+                # 该稀有度已抽空，移除后重建别名表
+                del weights[rarity]
+                sampler = AliasTable(weights) if weights else None
 
         if len(selected) < target:
             remaining = []
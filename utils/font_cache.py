@@ -0,0 +1,94 @@
+"""
+字体与文字缓存：
+- FontRegistry: 按 (字体路径, 字号, 粗体, 斜体) 缓存 pygame.font.Font，避免反复解析大体积中文字体文件
+- TextCache: 按 (字体, 文本, 颜色, 抗锯齿, 背景色) 缓存渲染结果的 LRU，重复的标签只需一次字典查询
+缓存的文字 Surface 为共享对象，调用方不要对其 set_alpha/fill 等原地修改（需要修改时先 copy()）
+"""
+from collections import OrderedDict
+import pygame
+
+TEXT_CACHE_SIZE = 1024  # 文字 Surface 缓存上限（条）
+
+class FontRegistry:
+    """进程级字体注册表"""
+    def __init__(self):
+        self._fonts = {}
+
+    def get(self, path, size, bold=False, italic=False):
+        key = (path, int(size), bool(bold), bool(italic))
+        font = self._fonts.get(key)
+        if font is None:
+            font = pygame.font.Font(path, key[1])
+            if bold:
+                font.set_bold(True)
+            if italic:
+                font.set_italic(True)
+            self._fonts[key] = font
+        return font
+
+    def clear(self):
+        self._fonts.clear()
+
+    def __len__(self):
+        return len(self._fonts)
+
+
+class TextCache:
+    """文字渲染结果的 LRU 缓存"""
+    def __init__(self, max_entries=TEXT_CACHE_SIZE):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color, background=None):
+        key = (font, text, tuple(color), bool(antialias), tuple(background) if background else None)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """缓存统计"""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._surfaces),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+
+# 全局实例
+_font_registry = None
+_text_cache = None
+
+def get_font_registry():
+    """获取全局字体注册表"""
+    global _font_registry
+    if _font_registry is None:
+        _font_registry = FontRegistry()
+    return _font_registry
+
+def get_text_cache():
+    """获取全局文字缓存"""
+    global _text_cache
+    if _text_cache is None:
+        _text_cache = TextCache()
+    return _text_cache
@@ -0,0 +1,81 @@
+"""
+帧调度：场景有动画或刚收到输入时按目标帧率运行，空闲时降为低帧率并阻塞等待事件
+（有输入立即唤醒），同时记录帧间隔与每帧工作耗时，提供百分位统计
+"""
+import time
+from collections import deque
+import numpy as np
+import pygame
+
+IDLE_FPS = 10          # 空闲时的帧率（仍需推进计时器，如海报轮播、AI 思考）
+IDLE_DELAY = 0.5       # 最后一次输入/动画之后保持全速的时间（秒）
+FRAME_HISTORY = 600    # 用于统计百分位的帧数
+
+# 视为用户输入的事件（收到后立即恢复全速）
+INPUT_EVENTS = {
+    pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL,
+    pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT,
+    pygame.FINGERDOWN, pygame.FINGERUP, pygame.FINGERMOTION,
+    pygame.WINDOWFOCUSGAINED, pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE,
+}
+
+class FrameScheduler:
+    """自适应帧率调度器"""
+    def __init__(self, clock, active_fps, idle_fps=IDLE_FPS, idle_delay=IDLE_DELAY, history=FRAME_HISTORY):
+        self.clock = clock
+        self.active_fps = active_fps
+        self.idle_fps = idle_fps
+        self.idle_delay = idle_delay
+        self.frame_times = deque(maxlen=history)  # 帧间隔（毫秒）
+        self.work_times = deque(maxlen=history)   # 每帧更新+绘制耗时（毫秒，不含等待）
+        self.idle = False
+        self._last_active = time.perf_counter()
+        self._frame_start = None
+        self._pending_events = []
+
+    def mark_active(self):
+        """有动画或输入：在 idle_delay 内保持全速"""
+        self._last_active = time.perf_counter()
+
+    def tick(self, animating=True):
+        """等待到下一帧，返回 dt（秒）；animating 为 False 且超过 idle_delay 时进入空闲节奏"""
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            self.work_times.append((now - self._frame_start) * 1000.0)
+        if animating:
+            self._last_active = now
+        self.idle = now - self._last_active >= self.idle_delay
+
+        if self.idle and self.idle_fps > 0:
+            # 阻塞等待事件（不占用 CPU），超时后仍推进一帧以更新计时器
+            wait_ms = 1000.0 / self.idle_fps - (now - (self._frame_start or now)) * 1000.0
+            event = pygame.event.wait(max(1, int(wait_ms)))
+            if event.type != pygame.NOEVENT:
+                self._pending_events.append(event)
+            elapsed_ms = self.clock.tick()
+            dt = min(elapsed_ms / 1000.0, 1.5 / self.idle_fps)  # 限制 dt，避免长时间阻塞后计时跳变
+        else:
+            elapsed_ms = self.clock.tick(self.active_fps)
+            dt = elapsed_ms / 1000.0
+
+        self.frame_times.append(elapsed_ms)
+        self._frame_start = time.perf_counter()
+        return dt
+
+    def get_events(self):
+        """取出本帧事件（含空闲等待期间收到的事件），有输入时恢复全速"""
+        events = self._pending_events + pygame.event.get()
+        self._pending_events = []
+        for event in events:
+            if event.type in INPUT_EVENTS:
+                self.mark_active()
+                break
+        return events
+
+    def percentiles(self, percents=(50, 95, 99), work=False):
+        """帧耗时百分位 {百分位: 毫秒}；work=True 时统计不含等待的工作耗时"""
+        samples = self.work_times if work else self.frame_times
+        if not samples:
+            return {p: 0.0 for p in percents}
+        values = np.percentile(np.fromiter(samples, dtype=np.float64), percents)
+        return dict(zip(percents, values.tolist()))
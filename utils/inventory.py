@@ -1,154 +1,249 @@
-"""库存管理系统 负责卡牌的保存、读取、统计"""
+"""库存管理系统 负责卡牌的保存、读取、统计
+
+存储方式: 按卡牌路径计数的快照 (inventory.json) + 追加写入的变更日志 (inventory.journal)
+每次保存只追加新变更，日志累积到一定条数后压缩为新快照（写临时文件后原子替换）
+"""
 import json
 import os
 from collections import defaultdict
 
 SAVE_FILE = "data/inventory.json"
+JOURNAL_FILE = "data/inventory.journal"
+SAVE_FORMAT = 2  # 1: 旧版逐张卡牌列表; 2: 按路径计数 + 变更日志
+COMPACT_THRESHOLD = 500  # 日志条数超过该值时压缩为快照
 
 """库存管理类"""
 class Inventory:
     def __init__(self):
-        self.cards = []  # 所有收集到的卡牌列表
+        self.entries = {}  # {card_path: {"path", "rarity", "count"}}，按首次获得顺序
         self.card_count = defaultdict(int)  # 卡牌数量统计 {card_path: count}
         self.total_draws = 0  # 总抽卡次数
+        self.total_cards = 0  # 当前持有卡牌总张数
         self.rarity_stats = defaultdict(int)  # 稀有度统计
-        
+        self._paths_by_rarity = defaultdict(dict)  # {rarity: {card_path: None}}
+        self._pending = []  # 尚未写入日志的变更
+        self._seq = 0  # 最近一条变更的序号（快照记录已包含的序号，加载时跳过旧日志）
+        self._journal_length = 0
+        self._signature = None  # 最近一次读写后的文件状态，未变化时 load() 直接跳过
+
         os.makedirs(os.path.dirname(SAVE_FILE), exist_ok=True) # 确保数据目录存在
-        
+
         self.load() # 加载数据
-    
+
     def _normalize_path(self, path: str) -> str:
         if not path:
             return ""
         return path.replace("\\", "/")
 
+    def _reset(self):
+        self.entries = {}
+        self.card_count = defaultdict(int)
+        self.total_draws = 0
+        self.total_cards = 0
+        self.rarity_stats = defaultdict(int)
+        self._paths_by_rarity = defaultdict(dict)
+        self._pending = []
+        self._seq = 0
+        self._journal_length = 0
+
+    # ========== 内存中的增量更新 ==========
+    def _apply_add(self, path, rarity, count=1):
+        entry = self.entries.get(path)
+        if entry is None:
+            entry = {"path": path, "rarity": rarity, "count": 0}
+            self.entries[path] = entry
+            self._paths_by_rarity[rarity][path] = None
+        entry["count"] += count
+        self.card_count[path] += count
+        self.rarity_stats[rarity] += count
+        self.total_draws += count
+        self.total_cards += count
+
+    def _apply_remove(self, path, rarity=None, count=1):
+        """移除至多 count 张，返回实际移除数量"""
+        entry = self.entries.get(path)
+        if entry is None or count <= 0:
+            return 0
+        removed = min(count, entry["count"])
+        entry["count"] -= removed
+        if entry["count"] <= 0:
+            del self.entries[path]
+            self._paths_by_rarity[entry["rarity"]].pop(path, None)
+            self.card_count.pop(path, None)
+        else:
+            self.card_count[path] = entry["count"]
+        card_rarity = rarity or entry["rarity"]
+        if card_rarity:
+            self.rarity_stats[card_rarity] = max(0, self.rarity_stats.get(card_rarity, 0) - removed)
+        self.total_draws = max(0, self.total_draws - removed)
+        self.total_cards -= removed
+        return removed
+
+    def _record(self, op, path, rarity, count):
+        self._seq += 1
+        self._pending.append({"seq": self._seq, "op": op, "path": path, "rarity": rarity, "n": count})
+
     def add_card(self, card_path, rarity):
         """添加卡牌到库存"""
         normalized_path = self._normalize_path(card_path)
-        card_data = {
-            "path": normalized_path,
-            "rarity": rarity,
-        }
-        
-        self.cards.append(card_data)
-        self.card_count[normalized_path] += 1
-        self.rarity_stats[rarity] += 1
-        self.total_draws += 1
-        
+        self._apply_add(normalized_path, rarity)
+        self._record("add", normalized_path, rarity, 1)
+
     def add_cards(self, cards_list):
         """批量添加卡牌"""
         for card_path, rarity in cards_list:
             self.add_card(card_path, rarity)
-        
-        # 批量添加后保存
+
+        # 批量添加后保存（仅追加日志）
         self.save()
-    
+
     def get_unique_cards(self):
         """获取所有不重复的卡牌"""
-        unique_cards = {}
-        for card in self.cards:
-            path = card["path"]
-            if path not in unique_cards:
-                unique_cards[path] = {
-                    "path": path,
-                    "rarity": card["rarity"],
-                    "count": self.card_count[path]
-                }
-        return list(unique_cards.values())
-    
+        return [dict(entry) for entry in self.entries.values()]
+
     def get_cards_by_rarity(self, rarity):
         """获取指定稀有度的卡牌"""
-        return [card for card in self.get_unique_cards() 
-                if card["rarity"] == rarity]
-    
+        entries = self.entries
+        return [dict(entries[path]) for path in self._paths_by_rarity.get(rarity, ())]
+
     def get_collection_stats(self):
         """获取收集统计"""
-        unique_count = len(self.card_count)
+        unique_count = len(self.entries)
         return {
             "total_draws": self.total_draws,
             "unique_cards": unique_count,
-            "total_cards": len(self.cards),
+            "total_cards": self.total_cards,
             "rarity_stats": dict(self.rarity_stats)
         }
-    
+
+    # ========== 持久化 ==========
+    def _file_signature(self):
+        signature = []
+        for path in (SAVE_FILE, JOURNAL_FILE):
+            try:
+                stat = os.stat(path)
+                signature.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
     def save(self):
-        """保存到本地文件"""
+        """保存到本地文件：追加尚未写入的变更，日志过长时压缩为快照"""
+        if not self._pending:
+            return
+        count = len(self._pending)
+        try:
+            if self._journal_length + count > COMPACT_THRESHOLD:
+                self._write_snapshot()
+            else:
+                lines = "".join(json.dumps(op, ensure_ascii=False) + "\n" for op in self._pending)
+                with open(JOURNAL_FILE, 'a', encoding='utf-8') as f:
+                    f.write(lines)
+                self._journal_length += count
+            self._pending = []
+            self._signature = self._file_signature()
+            print(f"库存已保存: {self.total_cards} 张卡牌")
+        except Exception as e:
+            print(f"保存失败: {e}")
+
+    def compact(self):
+        """立即将当前库存写为快照并清空日志"""
+        try:
+            self._write_snapshot()
+            self._pending = []
+            self._signature = self._file_signature()
+        except Exception as e:
+            print(f"保存失败: {e}")
+
+    def _write_snapshot(self):
         data = {
-            "cards": self.cards,
-            "card_count": dict(self.card_count),
+            "format": SAVE_FORMAT,
+            "seq": self._seq,
+            "entries": [[entry["path"], entry["rarity"], entry["count"]] for entry in self.entries.values()],
             "total_draws": self.total_draws,
             "rarity_stats": dict(self.rarity_stats)
         }
-        
-        try:
-            with open(SAVE_FILE, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-            print(f"库存已保存: {len(self.cards)} 张卡牌")
-        except Exception as e:
-            print(f"保存失败: {e}")
-    
+        tmp_path = SAVE_FILE + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, SAVE_FILE)
+        # 快照已包含全部变更（seq 之前的日志加载时会被跳过），截断失败也不会重复计数
+        with open(JOURNAL_FILE, 'w', encoding='utf-8'):
+            pass
+        self._journal_length = 0
+
     def load(self):
-        """从本地文件加载"""
-        if not os.path.exists(SAVE_FILE):
+        """从本地文件加载（文件自上次读写后未变化时跳过）"""
+        signature = self._file_signature()
+        if signature == self._signature:
+            return
+        if signature == (None, None):
             print("未找到存档，创建新库存")
+            self._signature = signature
             return
-        
+
         try:
-            with open(SAVE_FILE, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            raw_cards = data.get("cards", [])
-            self.cards = []
-            for card in raw_cards:
-                new_card = dict(card)
-                new_card["path"] = self._normalize_path(card.get("path", ""))
-                self.cards.append(new_card)
-            raw_counts = data.get("card_count", {})
-            self.card_count = defaultdict(int)
-            for path, count in raw_counts.items():
-                self.card_count[self._normalize_path(path)] = int(count)
-            self.total_draws = data.get("total_draws", 0)
-            self.rarity_stats = defaultdict(int, data.get("rarity_stats", {}))
-            
-            print(f"库存已加载: {len(self.cards)} 张卡牌")
+            self._reset()
+            if signature[0] is not None:
+                with open(SAVE_FILE, 'r', encoding='utf-8') as f:
+                    self._load_snapshot(json.load(f))
+            if signature[1] is not None:
+                self._replay_journal()
+            self._signature = signature
+            print(f"库存已加载: {self.total_cards} 张卡牌")
         except Exception as e:
             print(f"加载失败: {e}")
-    
+
+    def _load_snapshot(self, data):
+        if data.get("format", 1) < SAVE_FORMAT:
+            # 旧版存档：逐张卡牌列表，按路径合并计数
+            for card in data.get("cards", []):
+                self._apply_add(self._normalize_path(card.get("path", "")), card.get("rarity"))
+        else:
+            for path, rarity, count in data.get("entries", []):
+                self._apply_add(self._normalize_path(path), rarity, int(count))
+            self._seq = int(data.get("seq", 0))
+        self.total_draws = data.get("total_draws", self.total_draws)
+        self.rarity_stats = defaultdict(int, data.get("rarity_stats", self.rarity_stats))
+
+    def _replay_journal(self):
+        snapshot_seq = self._seq
+        with open(JOURNAL_FILE, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    op = json.loads(line)
+                except ValueError:
+                    # 写入中断产生的残缺行：之后的内容不可信，下次保存时直接压缩为快照
+                    self._journal_length = COMPACT_THRESHOLD
+                    break
+                self._journal_length += 1
+                seq = op.get("seq", 0)
+                if seq <= snapshot_seq:
+                    continue
+                self._seq = max(self._seq, seq)
+                if op.get("op") == "add":
+                    self._apply_add(op["path"], op.get("rarity"), op.get("n", 1))
+                elif op.get("op") == "remove":
+                    self._apply_remove(op["path"], op.get("rarity"), op.get("n", 1))
+
     def clear(self):
         """清空库存"""
-        self.cards = []
-        self.card_count = defaultdict(int)
-        self.total_draws = 0
-        self.rarity_stats = defaultdict(int)
-        self.save()
+        self._reset()
+        self.compact()
 
     def remove_card(self, card_path, rarity=None):
         """移除单张卡牌（用于工坊融合等消耗）"""
-        normalized = self._normalize_path(card_path)
-        for idx, card in enumerate(self.cards):
-            if self._normalize_path(card.get("path")) == normalized:
-                removed = self.cards.pop(idx)
-                key = normalized
-                if key in self.card_count:
-                    self.card_count[key] = max(0, self.card_count[key] - 1)
-                    if self.card_count[key] == 0:
-                        del self.card_count[key]
-                card_rarity = rarity or removed.get("rarity")
-                if card_rarity:
-                    self.rarity_stats[card_rarity] = max(0, self.rarity_stats.get(card_rarity, 0) - 1)
-                if self.total_draws > 0:
-                    self.total_draws -= 1
-                return True
-        return False
+        return self.remove_cards(card_path, 1, rarity=rarity) == 1
 
     def remove_cards(self, card_path, count, rarity=None):
         """移除多张卡牌，返回实际移除数量"""
-        removed = 0
-        for _ in range(max(0, int(count))):
-            if self.remove_card(card_path, rarity=rarity):
-                removed += 1
-            else:
-                break
+        normalized = self._normalize_path(card_path)
+        removed = self._apply_remove(normalized, rarity, max(0, int(count)))
+        if removed:
+            self._record("remove", normalized, rarity, removed)
         return removed
 
 
@@ -160,4 +255,4 @@ def get_inventory():
     global _inventory
     if _inventory is None:
         _inventory = Inventory()
-    return _inventory
\ No newline at end of file
+    return _inventory
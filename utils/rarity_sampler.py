@@ -0,0 +1,124 @@
+"""
+稀有度加权抽样：Walker 别名表（Alias Method）
+预处理 O(n)，单次抽样 O(1)，支持任意非负浮点权重（无需总和为100），
+批量抽样 sample(n) 基于 NumPy 向量化实现
+"""
+import random
+import numpy as np
+
+_MAX_CACHED_TABLES = 64  # 按权重内容缓存的别名表上限
+
+class AliasTable:
+    """Walker 别名表"""
+    def __init__(self, weights):
+        items = [(key, float(weight)) for key, weight in weights.items() if weight and weight > 0]
+        if not items:
+            raise ValueError("权重表为空或总权重为0")
+        self.keys = tuple(key for key, _ in items)
+        values = np.array([weight for _, weight in items], dtype=np.float64)
+        self.total = float(values.sum())
+        count = len(values)
+
+        # Vose 算法：小于平均值的列由大于平均值的列补足
+        scaled = values * count / self.total
+        prob = np.ones(count, dtype=np.float64)
+        alias = np.arange(count, dtype=np.int64)
+        small = [i for i in range(count) if scaled[i] < 1.0]
+        large = [i for i in range(count) if scaled[i] >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = l
+            scaled[l] = (scaled[l] + scaled[s]) - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+        # 剩余列因浮点误差略偏离1，直接视为满列
+
+        self.prob = prob
+        self.alias = alias
+        self._prob_list = prob.tolist()
+        self._alias_list = alias.tolist()
+
+    def __len__(self):
+        return len(self.keys)
+
+    @property
+    def probabilities(self):
+        """归一化后的概率 {key: p}"""
+        count = len(self.keys)
+        result = self.prob / count
+        np.add.at(result, self.alias, (1.0 - self.prob) / count)
+        return dict(zip(self.keys, result.tolist()))
+
+    def draw(self, rng=None):
+        """抽取一个 key，rng 为 random.Random（默认使用全局 random，便于统一设定种子）"""
+        u = (rng or random).random() * len(self.keys)
+        index = int(u)
+        if u - index >= self._prob_list[index]:
+            index = self._alias_list[index]
+        return self.keys[index]
+
+    def sample_indices(self, n, rng=None):
+        """批量抽取 n 个下标（NumPy 数组），rng 为 numpy.random.Generator"""
+        rng = rng or _default_np_rng()
+        # 一个均匀数同时决定列（整数部分）与列内取舍（小数部分）
+        u = rng.random(n) * len(self.keys)
+        columns = u.astype(np.int64)
+        accept = (u - columns) < self.prob[columns]
+        return np.where(accept, columns, self.alias[columns])
+
+    def sample(self, n, rng=None):
+        """批量抽取 n 个 key"""
+        keys = self.keys
+        return [keys[i] for i in self.sample_indices(n, rng).tolist()]
+
+    def counts(self, n, rng=None):
+        """抽取 n 次并统计各 key 出现次数（大规模模拟用，避免生成 key 列表）"""
+        counts = np.bincount(self.sample_indices(n, rng), minlength=len(self.keys))
+        return dict(zip(self.keys, counts.tolist()))
+
+
+_np_rng = None
+
+def _default_np_rng():
+    global _np_rng
+    if _np_rng is None:
+        _np_rng = np.random.default_rng()
+    return _np_rng
+
+_named_tables = None  # 卡池key -> 别名表（首次使用时一次性预编译）
+_cached_tables = {}
+
+def _get_named_tables():
+    global _named_tables
+    if _named_tables is None:
+        # 延迟导入：scenes 包初始化会导入使用本模块的场景
+        from scenes.gacha.gacha_probabilities import _PROB_TABLES
+        _named_tables = {key: AliasTable(table) for key, table in _PROB_TABLES.items()}
+    return _named_tables
+
+def get_sampler(table):
+    """
+    获取别名表：table 可为 _PROB_TABLES 中的卡池 key，或 {稀有度: 权重} 字典
+    （字典按内容缓存，内容变化后自动重建）；权重全为0时返回 None
+    """
+    if isinstance(table, str):
+        return _get_named_tables().get(table)
+    cache_key = tuple(table.items())
+    sampler = _cached_tables.get(cache_key)
+    if sampler is None:
+        try:
+            sampler = AliasTable(table)
+        except ValueError:
+            return None
+        if len(_cached_tables) >= _MAX_CACHED_TABLES:
+            _cached_tables.clear()
+        _cached_tables[cache_key] = sampler
+    return sampler
+
+def weighted_choice(table, rng=None):
+    """按权重抽取一个稀有度，权重表为空时返回 None"""
+    sampler = get_sampler(table)
+    if sampler is None:
+        return None
+    return sampler.draw(rng)